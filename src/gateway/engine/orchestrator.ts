@@ -304,9 +304,7 @@ export function createOrchestrator(config?: Partial<OrchestratorConfig>): Execut
 let defaultOrchestrator: ExecutionOrchestrator | null = null;
 
 export function getDefaultOrchestrator(): ExecutionOrchestrator {
-	if (!defaultOrchestrator) {
-		defaultOrchestrator = createOrchestrator();
-	}
+	defaultOrchestrator ??= createOrchestrator();
 	return defaultOrchestrator;
 }
 
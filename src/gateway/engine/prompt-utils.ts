@@ -14,6 +14,10 @@ import { logger } from "@/packages/logger";
 const MAX_PROMPT_LENGTH = 100000;
 const MAX_LINE_LENGTH = 10000;
 
+// Null bytes and control characters other than tab, newline and carriage return
+// biome-ignore lint/suspicious/noControlCharactersInRegex: Intentional validation of control characters
+const CONTROL_CHARS_REGEX = /[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]/;
+
 // XML escape patterns to prevent injection
 const XML_ESCAPE_REGEX = /[<>&'"]/g;
 const XML_ESCAPE_MAP: Record<string, string> = {
@@ -46,14 +50,29 @@ export function escapeXml(text: string): string {
 	return text.replace(XML_ESCAPE_REGEX, (char) => XML_ESCAPE_MAP[char]);
 }
 
+/**
+ * Returns the length of the first line exceeding MAX_LINE_LENGTH, or the longest line.
+ * Walks newline offsets instead of splitting so long prompts allocate no line array.
+ */
+function longestLineLength(text: string): number {
+	let longest = 0;
+	let start = 0;
+	while (start <= text.length) {
+		const newline = text.indexOf("\n", start);
+		const end = newline === -1 ? text.length : newline;
+		longest = Math.max(longest, end - start);
+		if (longest > MAX_LINE_LENGTH || newline === -1) break;
+		start = newline + 1;
+	}
+	return longest;
+}
+
 /**
  * Validates and sanitizes user input to prevent injection attacks
  */
 export function validateAndSanitizePrompt(text: string): PromptValidationResult {
 	// Check for null bytes and control characters
-	// biome-ignore lint/suspicious/noControlCharactersInRegex: Intentional validation of control characters
-	const hasControlChars = /[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]/.test(text);
-	if (hasControlChars) {
+	if (CONTROL_CHARS_REGEX.test(text)) {
 		logger.warn(
 			{
 				reason: "control_characters",
@@ -69,23 +88,21 @@ export function validateAndSanitizePrompt(text: string): PromptValidationResult
 	}
 
 	// Check for excessive line length (potential injection)
-	const lines = text.split("\n");
-	for (const line of lines) {
-		if (line.length > MAX_LINE_LENGTH) {
-			logger.warn(
-				{
-					reason: "line_too_long",
-					lineLength: line.length,
-					maxLength: MAX_LINE_LENGTH,
-				},
-				"Message validation failed: line too long",
-			);
-			return {
-				valid: false,
-				sanitized: "",
-				reason: "Message line too long",
-			};
-		}
+	const lineLength = longestLineLength(text);
+	if (lineLength > MAX_LINE_LENGTH) {
+		logger.warn(
+			{
+				reason: "line_too_long",
+				lineLength,
+				maxLength: MAX_LINE_LENGTH,
+			},
+			"Message validation failed: line too long",
+		);
+		return {
+			valid: false,
+			sanitized: "",
+			reason: "Message line too long",
+		};
 	}
 
 	// Escape XML to prevent injection in the message tags
@@ -5,18 +5,42 @@
 import fs from "node:fs/promises";
 import path from "node:path";
 
+// Real (symlink-free) path of each workspace root, resolved once per workspace. Entries are
+// never invalidated: a workspace symlink retargeted at runtime keeps its old real path until restart
+const workspaceRealPaths = new Map<string, string>();
+
+async function realWorkspacePath(normalizedWorkspace: string): Promise<string> {
+	const cached = workspaceRealPaths.get(normalizedWorkspace);
+	if (cached) {
+		return cached;
+	}
+	try {
+		const realWorkspace = await fs.realpath(normalizedWorkspace);
+		workspaceRealPaths.set(normalizedWorkspace, realWorkspace);
+		return realWorkspace;
+	} catch {
+		// Workspace missing or inaccessible; compare against the lexical path and retry next call
+		return normalizedWorkspace;
+	}
+}
+
+function isWithin(candidate: string, root: string): boolean {
+	return candidate === root || candidate.startsWith(root + path.sep);
+}
+
 /**
  * Resolve and validate a file path within the workspace.
  * Returns the absolute path or throws if path escapes the workspace.
  *
  * Uses fs.realpath() after resolution to detect symlink escapes,
- * then re-validates the real path is still within the workspace.
+ * then re-validates the real path is still within the workspace's real path
+ * (resolved once per workspace, so a symlinked workspace root still matches).
  */
 export async function resolveWorkspacePath(workspaceDir: string, relativePath: string): Promise<string> {
 	const resolved = path.resolve(workspaceDir, relativePath);
 	const normalizedWorkspace = path.resolve(workspaceDir);
 
-	if (!resolved.startsWith(normalizedWorkspace + path.sep) && resolved !== normalizedWorkspace) {
+	if (!isWithin(resolved, normalizedWorkspace)) {
 		throw new Error(`Path "${relativePath}" resolves outside of workspace directory. Path traversal is not allowed.`);
 	}
 
@@ -28,13 +52,9 @@ export async function resolveWorkspacePath(workspaceDir: string, relativePath: s
 		// File doesn't exist yet (e.g. write-file creating new files).
 		// Validate the parent directory instead.
 		const parentDir = path.dirname(resolved);
+		let realParent: string;
 		try {
-			const realParent = await fs.realpath(parentDir);
-			if (!realParent.startsWith(normalizedWorkspace + path.sep) && realParent !== normalizedWorkspace) {
-				throw new Error(
-					`Path "${relativePath}" resolves outside of workspace directory via symlink. Path traversal is not allowed.`,
-				);
-			}
+			realParent = await fs.realpath(parentDir);
 		} catch {
 			// Parent doesn't exist — will be created by caller (mkdir -p).
 			// Check if the workspace directory itself exists and is accessible
@@ -44,12 +64,19 @@ export async function resolveWorkspacePath(workspaceDir: string, relativePath: s
 				throw new Error(`Workspace directory "${workspaceDir}" does not exist or is not accessible`);
 			}
 			// The initial path.resolve check above is sufficient for the resolved path.
-			// Parent will be created by caller (mkdir -p).
+			return resolved;
+		}
+
+		// Checked outside the try above so a parent escaping through a symlink is not swallowed
+		if (!isWithin(realParent, await realWorkspacePath(normalizedWorkspace))) {
+			throw new Error(
+				`Path "${relativePath}" resolves outside of workspace directory via symlink. Path traversal is not allowed.`,
+			);
 		}
 		return resolved;
 	}
 
-	if (!realPath.startsWith(normalizedWorkspace + path.sep) && realPath !== normalizedWorkspace) {
+	if (!isWithin(realPath, await realWorkspacePath(normalizedWorkspace))) {
 		throw new Error(
 			`Path "${relativePath}" resolves outside of workspace directory via symlink. Path traversal is not allowed.`,
 		);
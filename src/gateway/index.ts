@@ -211,12 +211,17 @@ app.get("/memory/search", handleMemorySearch);
 app.post("/memory/search", handleMemorySearch);
 app.post("/memory/reindex", handleMemoryReindex);
 
+// Event-driven discovery; started before the initial scan so events raised during it
+// queue a follow-up refresh instead of being lost
+const stopInstanceWatcher = instanceManager.watch();
+
 // Initial Discovery - wait for it to complete before accepting requests
 logger.info("Starting initial instance discovery");
 await instanceManager.refresh();
 
-// Periodic Discovery Refresh
+// Periodic refresh only runs while the watcher is down
 const discoveryInterval = setInterval(async () => {
+	if (instanceManager.isWatching()) return;
 	logger.debug("Running periodic instance discovery refresh");
 	await instanceManager.refresh();
 }, GATEWAY_CONSTANTS.INSTANCES.REFRESH_INTERVAL_MS);
@@ -225,6 +230,7 @@ const discoveryInterval = setInterval(async () => {
 const shutdown = async (signal: string) => {
 	logger.info({ signal }, "Shutdown signal received. Closing resources...");
 	clearInterval(discoveryInterval);
+	stopInstanceWatcher();
 	await mailboxWatcher.stop();
 	await taskScheduler.stop();
 	await fileCleanupService.stop();
@@ -3,11 +3,63 @@ import path from "node:path";
 import { GATEWAY_CONSTANTS } from "@/gateway/consts";
 import { logger } from "@/packages/logger";
 
+// Extracts the workspace label value from docker's comma-joined "key=value,..." Labels column
+const ESCAPED_WORKSPACE_LABEL = GATEWAY_CONSTANTS.INSTANCES.LABEL.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
+const WORKSPACE_LABEL_REGEX = new RegExp(`(?:^|,)${ESCAPED_WORKSPACE_LABEL}=([^,]*)`);
+
+// Only ask docker to render the columns we read, instead of the full `{{json .}}` row
+const DOCKER_PS_FORMAT =
+	'{"ID":{{json .ID}},"Names":{{json .Names}},"Status":{{json .Status}},"Labels":{{json .Labels}},"Image":{{json .Image}}}';
+
+/**
+ * A discovered agent container. Instances are frozen because unchanged docker
+ * rows hand the same object out across refreshes.
+ */
 export interface AgentInstance {
-	name: string;
-	containerId: string;
-	status: string;
-	image: string;
+	readonly name: string;
+	readonly containerId: string;
+	readonly status: string;
+	readonly image: string;
+}
+
+// docker ps reports running containers as "Up <duration>"; anchored so one scan decides it
+const RUNNING_STATUS_REGEX = /^up\b/i;
+
+// Well-known docker install locations checked after DOCKER_BIN and PATH
+const DOCKER_FALLBACK_PATHS: readonly string[] = Object.freeze([
+	"/usr/local/bin/docker",
+	"/opt/homebrew/bin/docker",
+	"/usr/bin/docker",
+]);
+
+// Per-instance IPC subdirectories created on discovery
+const IPC_SUBDIRS: readonly string[] = Object.freeze(["messages", "tasks", "snapshots"]);
+
+// Yields docker binary locations in lookup order so resolution stops at the first hit
+function* dockerBinaryCandidates(): Generator<string> {
+	if (process.env.DOCKER_BIN) {
+		yield process.env.DOCKER_BIN;
+	}
+	for (const dir of (process.env.PATH || "").split(path.delimiter)) {
+		if (dir) yield path.join(dir, "docker");
+	}
+	yield* DOCKER_FALLBACK_PATHS;
+}
+
+// Delay before retrying an event-triggered refresh whose docker ps failed; the periodic
+// poll is paused while the watcher runs, so nothing else would repair the instance list
+const EVENT_REFRESH_RETRY_MS = 5000;
+
+// Container lifecycle events that can change the discovered instance set or status
+const WATCHED_DOCKER_EVENTS: readonly string[] = Object.freeze(["start", "unpause", "pause", "die", "destroy"]);
+
+// Row shape rendered by DOCKER_PS_FORMAT
+interface DockerPsRow {
+	ID: string;
+	Names: string;
+	Status: string;
+	Labels: string;
+	Image: string;
 }
 
 export class InstanceManager {
@@ -16,23 +68,21 @@ export class InstanceManager {
 	private totalParseAttempts = 0;
 	private dockerUnavailable = false;
 	private dockerBinary: string | null | undefined;
+	private preparedIpcInstances = new Set<string>();
+	private parsedRows = new Map<string, AgentInstance>();
+	private eventWatcher: ReturnType<typeof Bun.spawn> | null = null;
+	private inflightRefresh: Promise<AgentInstance[]> | null = null;
+	private queuedRefresh: Promise<AgentInstance[]> | null = null;
+	private lastRefreshFailed = false;
+	private eventRetryTimer: ReturnType<typeof setTimeout> | null = null;
+	private eventRetryDelayMs = EVENT_REFRESH_RETRY_MS;
 
 	private resolveDockerBinary(): string | null {
 		if (this.dockerBinary !== undefined) {
 			return this.dockerBinary;
 		}
 
-		const candidates: string[] = [];
-		if (process.env.DOCKER_BIN) {
-			candidates.push(process.env.DOCKER_BIN);
-		}
-		for (const dir of (process.env.PATH || "").split(path.delimiter)) {
-			if (!dir) continue;
-			candidates.push(path.join(dir, "docker"));
-		}
-		candidates.push("/usr/local/bin/docker", "/opt/homebrew/bin/docker", "/usr/bin/docker");
-
-		for (const candidate of candidates) {
+		for (const candidate of dockerBinaryCandidates()) {
 			if (fs.existsSync(candidate)) {
 				this.dockerBinary = candidate;
 				return candidate;
@@ -43,7 +93,31 @@ export class InstanceManager {
 		return null;
 	}
 
-	async refresh(): Promise<AgentInstance[]> {
+	/**
+	 * Re-discover instances from docker. A caller arriving while a discovery is
+	 * running may be reacting to a change that docker ps has already missed, so
+	 * one follow-up discovery is queued behind it; every late caller shares that
+	 * follow-up rather than each spawning their own docker ps.
+	 */
+	refresh(): Promise<AgentInstance[]> {
+		if (!this.inflightRefresh) {
+			this.inflightRefresh = this.discover().finally(() => {
+				this.inflightRefresh = null;
+			});
+			return this.inflightRefresh;
+		}
+
+		if (!this.queuedRefresh) {
+			const runQueued = () => {
+				this.queuedRefresh = null;
+				return this.refresh();
+			};
+			this.queuedRefresh = this.inflightRefresh.then(runQueued, runQueued);
+		}
+		return this.queuedRefresh;
+	}
+
+	private async discover(): Promise<AgentInstance[]> {
 		if (this.dockerUnavailable) {
 			return Array.from(this.instances.values());
 		}
@@ -64,56 +138,73 @@ export class InstanceManager {
 				"--filter",
 				`label=${GATEWAY_CONSTANTS.INSTANCES.LABEL}`,
 				"--format",
-				"{{json .}}",
+				DOCKER_PS_FORMAT,
 			]);
 
-			// Wait for process to complete and read output
-			await proc.exited;
-			const output = await new Response(proc.stdout).text();
+			// Drain stdout while waiting for exit so a large listing cannot stall on a full pipe
+			const [output, exitCode] = await Promise.all([new Response(proc.stdout).text(), proc.exited]);
+			if (exitCode !== 0) {
+				// Keep the last known instances rather than treating a failed listing as "no containers"
+				this.lastRefreshFailed = true;
+				logger.warn({ exitCode }, "docker ps failed; keeping previously discovered instances");
+				return Array.from(this.instances.values());
+			}
 			const lines = output.trim().split("\n");
 
 			const newInstances = new Map<string, AgentInstance>();
+			// Rows unchanged since the previous refresh reuse their parsed instance
+			const previousRows = this.parsedRows;
+			const parsedRows = new Map<string, AgentInstance>();
 
 			for (const line of lines) {
 				if (!line.trim()) continue;
 				this.totalParseAttempts++;
 
+				const cached = previousRows.get(line);
+				if (cached) {
+					newInstances.set(cached.name, cached);
+					parsedRows.set(line, cached);
+					continue;
+				}
+
+				let data: Partial<DockerPsRow> | null;
 				try {
-					const data = JSON.parse(line);
-					// data example: {"ID":"...","Names":"...","Status":"...","Labels":"...","Image":"..."}
-
-					// Parse labels to get the actual instance name if provided
-					const labels = data.Labels.split(",").reduce(
-						(acc: Record<string, string>, curr: string) => {
-							const [key, val] = curr.split("=");
-							acc[key] = val;
-							return acc;
-						},
-						{} as Record<string, string>,
-					);
-
-					const name = labels[GATEWAY_CONSTANTS.INSTANCES.LABEL] || data.Names;
-
-					newInstances.set(name, {
-						name,
-						containerId: data.ID,
-						status: data.Status.toLowerCase().includes("up") ? "running" : "stopped",
-						image: data.Image,
-					});
+					data = JSON.parse(line);
 				} catch (e) {
 					this.parseErrorCount++;
 					logger.warn({ line, error: e }, "Error parsing docker ps output");
+					continue;
+				}
+
+				// Check the row shape up front rather than letting a missing column throw
+				if (!data || typeof data.ID !== "string" || typeof data.Names !== "string") {
+					this.parseErrorCount++;
+					logger.warn({ line }, "Skipping docker ps row without ID/Names");
+					continue;
 				}
+
+				// Use the workspace label as the instance name if provided
+				const name = data.Labels?.match(WORKSPACE_LABEL_REGEX)?.[1] || data.Names;
+
+				const instance: AgentInstance = Object.freeze({
+					name,
+					containerId: data.ID,
+					status: RUNNING_STATUS_REGEX.test(data.Status ?? "") ? "running" : "stopped",
+					image: data.Image ?? "",
+				});
+				newInstances.set(name, instance);
+				parsedRows.set(line, instance);
 			}
 
 			this.instances = newInstances;
+			this.parsedRows = parsedRows;
 			logger.debug({ count: this.instances.size }, "Discovered agent instances");
 
-			// Setup IPC directories for all discovered instances
-			for (const instance of this.instances.values()) {
-				this.setupIpcDirectories(instance.name);
-			}
+			// Setup IPC directories concurrently, skipping instances prepared by an earlier refresh
+			const unprepared = Array.from(this.instances.keys()).filter((name) => !this.preparedIpcInstances.has(name));
+			await Promise.all(unprepared.map((name) => this.setupIpcDirectories(name)));
 
+			this.lastRefreshFailed = false;
 			return Array.from(this.instances.values());
 		} catch (error) {
 			if (error && typeof error === "object" && "code" in error && (error as { code?: string }).code === "ENOENT") {
@@ -121,23 +212,111 @@ export class InstanceManager {
 				logger.warn({ dockerBinary }, "Docker CLI not executable; disabling instance discovery until gateway restart");
 				return Array.from(this.instances.values());
 			}
+			this.lastRefreshFailed = true;
 			logger.error({ error }, "Failed to refresh instances");
 			return Array.from(this.instances.values());
 		}
 	}
 
-	private setupIpcDirectories(instanceName: string) {
-		const baseDir = path.resolve(GATEWAY_CONSTANTS.CONFIG.IPC_DIR, instanceName);
-		const dirs = ["messages", "tasks", "snapshots"];
+	/**
+	 * Subscribe to docker container events and refresh only when a labelled
+	 * container changes state. Returns a function that stops the watcher.
+	 */
+	watch(): () => void {
+		if (this.eventWatcher) {
+			return () => this.stopWatching();
+		}
+
+		const dockerBinary = this.dockerUnavailable ? null : this.resolveDockerBinary();
+		if (!dockerBinary) {
+			logger.warn("Docker CLI not available; instance event watcher not started");
+			return () => {};
+		}
+
+		try {
+			this.eventWatcher = Bun.spawn(
+				[
+					dockerBinary,
+					"events",
+					"--filter",
+					"type=container",
+					"--filter",
+					`label=${GATEWAY_CONSTANTS.INSTANCES.LABEL}`,
+					...WATCHED_DOCKER_EVENTS.flatMap((event) => ["--filter", `event=${event}`]),
+					"--format",
+					"{{.Action}}",
+				],
+				{ stdout: "pipe", stderr: "ignore" },
+			);
+		} catch (error) {
+			logger.warn({ error }, "Failed to start docker event watcher");
+			return () => {};
+		}
+
+		void this.consumeEvents(this.eventWatcher);
+		logger.info("Watching docker events for instance changes");
+		return () => this.stopWatching();
+	}
+
+	isWatching(): boolean {
+		return this.eventWatcher !== null;
+	}
 
-		for (const dir of dirs) {
-			const fullPath = path.join(baseDir, dir);
-			if (!fs.existsSync(fullPath)) {
-				fs.mkdirSync(fullPath, { recursive: true });
+	private stopWatching(): void {
+		this.eventWatcher?.kill();
+		this.eventWatcher = null;
+		if (this.eventRetryTimer) {
+			clearTimeout(this.eventRetryTimer);
+			this.eventRetryTimer = null;
+		}
+	}
+
+	// Event-triggered refresh that retries after a delay until docker ps succeeds or the watcher stops
+	private async refreshForEvent(): Promise<void> {
+		await this.refresh();
+		if (!this.lastRefreshFailed || this.dockerUnavailable || this.eventRetryTimer || !this.eventWatcher) {
+			return;
+		}
+
+		logger.warn({ retryMs: this.eventRetryDelayMs }, "Event-triggered instance refresh failed; scheduling retry");
+		this.eventRetryTimer = setTimeout(() => {
+			this.eventRetryTimer = null;
+			void this.refreshForEvent();
+		}, this.eventRetryDelayMs);
+	}
+
+	private async consumeEvents(proc: ReturnType<typeof Bun.spawn>): Promise<void> {
+		const reader = (proc.stdout as ReadableStream<Uint8Array>).getReader();
+		const decoder = new TextDecoder();
+
+		try {
+			while (true) {
+				const { done, value } = await reader.read();
+				if (done) break;
+				// One refresh per chunk: a burst of events delivered together triggers a single docker ps
+				if (decoder.decode(value, { stream: true }).includes("\n")) {
+					await this.refreshForEvent();
+				}
+			}
+		} catch (error) {
+			logger.warn({ error }, "Docker event watcher failed");
+		} finally {
+			reader.releaseLock();
+			if (this.eventWatcher === proc) {
+				this.eventWatcher = null;
+				logger.warn("Docker event watcher exited; falling back to periodic discovery");
 			}
 		}
 	}
 
+	private async setupIpcDirectories(instanceName: string): Promise<void> {
+		const baseDir = path.resolve(GATEWAY_CONSTANTS.CONFIG.IPC_DIR, instanceName);
+
+		// Recursive mkdir is a no-op for existing directories, so no existence check is needed
+		await Promise.all(IPC_SUBDIRS.map((dir) => fs.promises.mkdir(path.join(baseDir, dir), { recursive: true })));
+		this.preparedIpcInstances.add(instanceName);
+	}
+
 	getInstances(): AgentInstance[] {
 		return Array.from(this.instances.values());
 	}
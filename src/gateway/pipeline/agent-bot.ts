@@ -259,9 +259,13 @@ export class AgentBot implements Bot {
 		}
 
 		if (!instance) {
-			// Retry with a short backoff in case the cache is stale or the container is starting
-			const retryDelaysMs = [500, 1500];
+			// Refresh now and again after each backoff in case the cache is stale or the container is starting;
+			// every wait is followed by a lookup so no delay is spent without a chance to succeed
+			const retryDelaysMs = [0, 500, 1500];
 			for (const delayMs of retryDelaysMs) {
+				if (delayMs > 0) {
+					await new Promise((resolve) => setTimeout(resolve, delayMs));
+				}
 				const refreshed = await instanceManager.refresh();
 				instance = refreshed.find((i) => i.status === "running");
 				if (instance) {
@@ -272,7 +276,6 @@ export class AgentBot implements Bot {
 					await this.persistenceManager.setSession(message.chatId, instance.name);
 					break;
 				}
-				await new Promise((resolve) => setTimeout(resolve, delayMs));
 			}
 
 			if (!instance) {
@@ -1214,8 +1217,12 @@ export class AgentBot implements Bot {
 	}
 }
 
+// Characters that break Telegram legacy Markdown: underscores are escaped, emphasis/code markers dropped
+const TELEGRAM_MARKDOWN_REGEX = /[_*`]/g;
+
 function sanitizeForTelegramMarkdown(input: string): string {
-	return input.replace(/_/g, "\\_").replace(/\*/g, "").replace(/`/g, "");
+	// One scan over the output instead of a full copy per character class
+	return input.replace(TELEGRAM_MARKDOWN_REGEX, (char) => (char === "_" ? "\\_" : ""));
 }
 
 const AGENTS_TEMPLATE = [
@@ -131,9 +131,11 @@ export class MenuBot implements Bot {
 				if (allFolders.length === 0) {
 					await this.channel.sendMessage(message.chatId, "⚠️ No workspaces found in root folder.");
 				} else {
+					// Index instances by name once instead of scanning the list for every folder
+					const instancesByName = new Map(allInstances.map((i) => [i.name, i]));
 					const workspaces = allFolders.map((folder) => {
 						const isActive = folder === currentSession;
-						const inst = allInstances.find((i) => i.name === folder);
+						const inst = instancesByName.get(folder);
 						return {
 							name: folder,
 							status: inst?.status || "stopped",
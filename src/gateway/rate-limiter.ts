@@ -6,6 +6,21 @@ const DEFAULT_WINDOW_SECONDS = 60;
 const CLEANUP_INTERVAL_MS = 5 * 60 * 1000; // 5 minutes
 const _MAX_IDLE_TIME_MS = 10 * 60 * 1000; // 10 minutes
 
+/**
+ * Drop timestamps that fell out of the window, in place. Timestamps are appended
+ * in arrival order, so expired entries always form a prefix of the array.
+ */
+function pruneExpired(timestamps: number[], now: number, windowMs: number): number[] {
+	let expired = 0;
+	while (expired < timestamps.length && now - timestamps[expired] >= windowMs) {
+		expired++;
+	}
+	if (expired > 0) {
+		timestamps.splice(0, expired);
+	}
+	return timestamps;
+}
+
 export class RateLimiter {
 	private requests: Map<string | number, number[]> = new Map();
 	private limit: number;
@@ -20,27 +35,30 @@ export class RateLimiter {
 
 	async isAllowed(id: string | number): Promise<boolean> {
 		const now = Date.now();
-		const timestamps = this.requests.get(id) || [];
+		let timestamps = this.requests.get(id);
+		if (!timestamps) {
+			timestamps = [];
+			this.requests.set(id, timestamps);
+		}
 
-		// Filter out old timestamps (outside the time window)
-		const recent = timestamps.filter((ts) => now - ts < this.windowMs);
+		// Drop old timestamps (outside the time window); the window holds at most `limit` entries
+		const recent = pruneExpired(timestamps, now, this.windowMs);
 
 		if (recent.length >= this.limit) {
 			return false;
 		}
 
 		recent.push(now);
-		this.requests.set(id, recent);
 		return true;
 	}
 
 	async getRetryAfter(id: string | number): Promise<number> {
 		const now = Date.now();
-		const timestamps = this.requests.get(id) || [];
-		if (timestamps.length === 0) return 0;
+		const timestamps = this.requests.get(id);
+		if (!timestamps || timestamps.length === 0) return 0;
 
 		// Get the oldest timestamp that's still within the window
-		const validTimestamps = timestamps.filter((ts) => now - ts < this.windowMs);
+		const validTimestamps = pruneExpired(timestamps, now, this.windowMs);
 		if (validTimestamps.length === 0) return 0;
 
 		const oldest = validTimestamps[0];
@@ -66,14 +84,12 @@ export class RateLimiter {
 
 		for (const [id, timestamps] of this.requests.entries()) {
 			// Remove timestamps outside the window
-			const validTimestamps = timestamps.filter((ts) => now - ts < this.windowMs);
+			pruneExpired(timestamps, now, this.windowMs);
 
 			// If no recent timestamps or all are very old, remove the entire entry
-			if (validTimestamps.length === 0) {
+			if (timestamps.length === 0) {
 				this.requests.delete(id);
 				removedCount++;
-			} else if (validTimestamps.length < timestamps.length) {
-				this.requests.set(id, validTimestamps);
 			}
 		}
 
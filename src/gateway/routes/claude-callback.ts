@@ -29,6 +29,20 @@ const MAX_CALLBACK_RETRIES = 3;
  */
 const RETRY_DELAY_MS = 1000;
 
+/**
+ * HTTP responses for response-file read failures, looked up by error type
+ */
+const FILE_READ_ERROR_RESPONSES: Partial<Record<FileReadErrorType, { statusCode: number; userMessage: string }>> = {
+	[FileReadErrorType.NOT_FOUND]: { statusCode: 404, userMessage: "Response file not found" },
+	[FileReadErrorType.INVALID_JSON]: { statusCode: 422, userMessage: "Corrupted response file" },
+	[FileReadErrorType.SCHEMA_VALIDATION_FAILED]: { statusCode: 422, userMessage: "Corrupted response file" },
+	[FileReadErrorType.TOO_LARGE]: { statusCode: 413, userMessage: "Response file too large" },
+	[FileReadErrorType.PERMISSION_DENIED]: { statusCode: 403, userMessage: "Permission denied" },
+	[FileReadErrorType.DIRECTORY_TRAVERSAL]: { statusCode: 400, userMessage: "Invalid file path" },
+};
+
+const DEFAULT_FILE_READ_ERROR_RESPONSE = { statusCode: 500, userMessage: "Failed to read response file" };
+
 /**
  * Execute a function with retry logic
  */
@@ -333,32 +347,7 @@ export async function handleClaudeCallback(c: Context, context: CallbackContext)
 				);
 
 				// Map error types to HTTP status codes
-				let statusCode = 500;
-				let userMessage = "Failed to read response file";
-
-				switch (err.type) {
-					case FileReadErrorType.NOT_FOUND:
-						statusCode = 404;
-						userMessage = "Response file not found";
-						break;
-					case FileReadErrorType.INVALID_JSON:
-					case FileReadErrorType.SCHEMA_VALIDATION_FAILED:
-						statusCode = 422;
-						userMessage = "Corrupted response file";
-						break;
-					case FileReadErrorType.TOO_LARGE:
-						statusCode = 413;
-						userMessage = "Response file too large";
-						break;
-					case FileReadErrorType.PERMISSION_DENIED:
-						statusCode = 403;
-						userMessage = "Permission denied";
-						break;
-					case FileReadErrorType.DIRECTORY_TRAVERSAL:
-						statusCode = 400;
-						userMessage = "Invalid file path";
-						break;
-				}
+				const { statusCode, userMessage } = FILE_READ_ERROR_RESPONSES[err.type] ?? DEFAULT_FILE_READ_ERROR_RESPONSE;
 
 				return c.json(createErrorResponse(userMessage, err.type), statusCode);
 			}
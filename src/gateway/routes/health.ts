@@ -6,6 +6,10 @@ import { GATEWAY_CONSTANTS } from "@/gateway/consts";
 import { instanceManager } from "@/gateway/instance-manager";
 import { HealthReport } from "@/gateway/output/HealthReport";
 import { getOutputFormat, prefersJson } from "@/gateway/utils/request-utils";
+import { mapWithConcurrency } from "@/packages/async";
+
+// Upper bound on concurrent per-instance mailbox reads while gathering diagnostics
+const MAILBOX_SCAN_CONCURRENCY = 16;
 
 interface Diagnostics {
 	time: string;
@@ -168,18 +172,19 @@ export const handleHealth = async (c: Context) => {
 	};
 
 	// 5. Mailbox Stats
-	let pendingCount = 0;
 	try {
 		const instanceDirs = await fs.readdir(ipcDir);
-		for (const inst of instanceDirs) {
+		const counts = await mapWithConcurrency(instanceDirs, MAILBOX_SCAN_CONCURRENCY, async (inst) => {
 			const msgDir = path.join(ipcDir, inst, "messages");
 			try {
 				const files = await fs.readdir(msgDir);
-				pendingCount += files.filter((f) => f.endsWith(".json")).length;
+				return files.filter((f) => f.endsWith(".json")).length;
 			} catch {
 				// Skip missing msg dirs
+				return 0;
 			}
-		}
+		});
+		const pendingCount = counts.reduce((sum, count) => sum + count, 0);
 		diagnostics.mailbox_stats = {
 			pending_proactive_messages: pendingCount,
 		};
@@ -67,6 +67,20 @@ interface CircuitBreakerState {
 	failureCount: number;
 }
 
+/**
+ * Exponentially decayed failure count, updated on each failure
+ */
+interface FailureRate {
+	rate: number;
+	updatedAt: number;
+}
+
+// Upper bound on a single retry delay, however many attempts have been made
+const MAX_BACKOFF_MS = 30000;
+
+// Decay time constant for failure rates: a failure's weight falls to 1/e after one minute
+const FAILURE_RATE_DECAY_MS = 60000;
+
 /**
  * Error recovery service with circuit breakers and retry logic
  */
@@ -74,6 +88,7 @@ export class ErrorRecoveryService {
 	private failureCounters: Map<ErrorType, number> = new Map();
 	private circuitBreakers: Map<ErrorType, CircuitBreakerState> = new Map();
 	private lastFailures: Map<ErrorType, number> = new Map();
+	private failureRates: Map<ErrorType, FailureRate> = new Map();
 	private recoveryStrategies: Map<ErrorType, RecoveryStrategy> = new Map();
 	private healthCheckTimer: ReturnType<typeof setInterval> | null = null;
 	private readonly HEALTH_CHECK_INTERVAL = 60000; // 60 seconds
@@ -220,15 +235,16 @@ export class ErrorRecoveryService {
 				return true;
 			}
 
-			// Increment failure counter
-			this.incrementFailureCounter(errorType);
+			// Increment failure counter; one clock read stamps both the counter and any breaker it trips
+			const now = Date.now();
+			const failures = this.incrementFailureCounter(errorType, now);
+			const failureRate = this.recordFailureRate(errorType, now);
 
-			// Check if we should open circuit breaker
-			if (strategy.circuitBreakerThreshold) {
-				const failures = this.failureCounters.get(errorType) || 0;
-				if (failures >= strategy.circuitBreakerThreshold) {
-					this.openCircuitBreaker(errorType);
-				}
+			// Open the circuit breaker on consecutive failures, or on a sustained failure rate whose
+			// counter keeps being reset by the odd success in between
+			const threshold = strategy.circuitBreakerThreshold;
+			if (threshold && (failures >= threshold || failureRate >= threshold)) {
+				this.openCircuitBreaker(errorType, failures, now);
 			}
 
 			this.emit("recovery:failure", context);
@@ -292,7 +308,7 @@ export class ErrorRecoveryService {
 			} catch (err) {
 				this.logger.warn({ err, attempt, maxRetries: strategy.maxRetries }, "File write retry failed");
 				if (attempt < strategy.maxRetries) {
-					await this.sleep(strategy.backoffMs * attempt);
+					await this.sleep(this.backoffDelay(strategy, attempt));
 				}
 			}
 		}
@@ -336,8 +352,7 @@ export class ErrorRecoveryService {
 				return true;
 			} catch (_err) {
 				if (attempt < strategy.maxRetries) {
-					const delay = strategy.backoffMs * 2 ** (attempt - 1);
-					await this.sleep(delay);
+					await this.sleep(this.backoffDelay(strategy, attempt));
 				}
 			}
 		}
@@ -413,12 +428,32 @@ export class ErrorRecoveryService {
 	}
 
 	/**
-	 * Increment failure counter for error type
+	 * Increment failure counter for error type and return the new count
+	 */
+	private incrementFailureCounter(errorType: ErrorType, now: number): number {
+		const failures = (this.failureCounters.get(errorType) || 0) + 1;
+		this.failureCounters.set(errorType, failures);
+		this.lastFailures.set(errorType, now);
+		return failures;
+	}
+
+	/**
+	 * Add one failure to the decayed failure rate for error type and return the new rate.
+	 * Unlike the failure counter, the rate is not reset by a successful recovery
+	 */
+	private recordFailureRate(errorType: ErrorType, now: number): number {
+		const rate = this.decayedFailureRate(errorType, now) + 1;
+		this.failureRates.set(errorType, { rate, updatedAt: now });
+		return rate;
+	}
+
+	/**
+	 * Failure rate for error type decayed to `now`; O(1), no window scan
 	 */
-	private incrementFailureCounter(errorType: ErrorType): void {
-		const current = this.failureCounters.get(errorType) || 0;
-		this.failureCounters.set(errorType, current + 1);
-		this.lastFailures.set(errorType, Date.now());
+	private decayedFailureRate(errorType: ErrorType, now: number): number {
+		const entry = this.failureRates.get(errorType);
+		if (!entry) return 0;
+		return entry.rate * Math.exp(-(now - entry.updatedAt) / FAILURE_RATE_DECAY_MS);
 	}
 
 	/**
@@ -439,11 +474,11 @@ export class ErrorRecoveryService {
 	/**
 	 * Open circuit breaker for error type
 	 */
-	private openCircuitBreaker(errorType: ErrorType): void {
+	private openCircuitBreaker(errorType: ErrorType, failureCount: number, now: number): void {
 		this.circuitBreakers.set(errorType, {
 			isOpen: true,
-			lastFailureTime: Date.now(),
-			failureCount: this.failureCounters.get(errorType) || 0,
+			lastFailureTime: now,
+			failureCount,
 		});
 		this.emit("circuit_breaker:open", { errorType });
 		this.logger.warn({ errorType }, "Circuit breaker opened");
@@ -474,6 +509,15 @@ export class ErrorRecoveryService {
 		}
 	}
 
+	/**
+	 * Exponential backoff for the given attempt, capped at MAX_BACKOFF_MS. Jitter picks a
+	 * delay between half and all of it so concurrent retries do not fire in lockstep.
+	 */
+	private backoffDelay(strategy: RecoveryStrategy, attempt: number): number {
+		const delay = Math.min(strategy.backoffMs * 2 ** (attempt - 1), MAX_BACKOFF_MS);
+		return delay / 2 + Math.random() * (delay / 2);
+	}
+
 	/**
 	 * Sleep utility
 	 */
@@ -490,9 +534,12 @@ export class ErrorRecoveryService {
 			failures: number;
 			circuitOpen: boolean;
 			lastFailure: number;
+			failureRate: number;
 		}
 	> {
-		const stats: Record<string, { failures: number; circuitOpen: boolean; lastFailure: number }> = {};
+		const stats: Record<string, { failures: number; circuitOpen: boolean; lastFailure: number; failureRate: number }> =
+			{};
+		const now = Date.now();
 
 		for (const [errorType, count] of this.failureCounters.entries()) {
 			const state = this.circuitBreakers.get(errorType);
@@ -500,6 +547,7 @@ export class ErrorRecoveryService {
 				failures: count,
 				circuitOpen: state?.isOpen ?? false,
 				lastFailure: this.lastFailures.get(errorType) || 0,
+				failureRate: this.decayedFailureRate(errorType, now),
 			};
 		}
 
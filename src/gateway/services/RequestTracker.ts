@@ -8,6 +8,13 @@ import type {
 } from "@/gateway/schemas/request-state";
 import { logger } from "@/packages/logger";
 
+/**
+ * JSON.stringify replacer that drops null-valued object fields (undefined ones are already skipped)
+ */
+function omitNullFields(_key: string, value: unknown): unknown {
+	return value === null ? undefined : value;
+}
+
 /**
  * RequestTracker - Tracks Claude execution requests through their lifecycle
  *
@@ -184,8 +191,7 @@ export class RequestTracker {
 				if (!file.endsWith(".json")) continue;
 
 				try {
-					const content = await fs.readFile(path.join(wsDir, file), "utf-8");
-					const state: RequestState = JSON.parse(content);
+					const state = await this.readWorkspaceState(wsDir, file);
 
 					// Apply filters
 					if (options?.state && state.state !== options.state) {
@@ -214,6 +220,23 @@ export class RequestTracker {
 		}
 	}
 
+	/**
+	 * Read a workspace-indexed state file, serving a copy of the cached state for
+	 * requests this tracker already holds instead of re-parsing the file. Files
+	 * read from disk are not added to the cache, so listing old requests does not
+	 * grow it.
+	 */
+	private async readWorkspaceState(wsDir: string, file: string): Promise<RequestState> {
+		const requestId = file.slice(0, -".json".length);
+		const cached = this.config.enableCache ? this.cache.get(requestId) : undefined;
+		if (cached) {
+			return { ...cached };
+		}
+
+		const content = await fs.readFile(path.join(wsDir, file), "utf-8");
+		return JSON.parse(content);
+	}
+
 	/**
 	 * Delete request state
 	 */
@@ -255,12 +278,14 @@ export class RequestTracker {
 		this.assertValidRequestId(state.requestId);
 		this.assertValidWorkspace(state.workspace);
 
-		const json = JSON.stringify(state, null, 2);
+		// Encode once; both copies are written from the same bytes. State files are machine-read,
+		// so they are written compact and without null-valued optional fields
+		const payload = Buffer.from(JSON.stringify(state, omitNullFields));
 
 		// Write to main location (atomic write with temp file)
 		const mainPath = this.getStateFilePath(state.requestId);
 		const tmpPath = `${mainPath}.tmp`;
-		await fs.writeFile(tmpPath, json);
+		await fs.writeFile(tmpPath, payload);
 		await fs.rename(tmpPath, mainPath);
 
 		// Write to workspace-indexed location
@@ -268,7 +293,7 @@ export class RequestTracker {
 		await fs.mkdir(wsDir, { recursive: true });
 		const wsPath = this.getWorkspaceRequestFilePath(state.workspace, state.requestId);
 		const wsTmpPath = `${wsPath}.tmp`;
-		await fs.writeFile(wsTmpPath, json);
+		await fs.writeFile(wsTmpPath, payload);
 		await fs.rename(wsTmpPath, wsPath);
 	}
 
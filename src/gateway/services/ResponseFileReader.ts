@@ -3,6 +3,12 @@ import path from "node:path";
 import { type ResponseFile, ResponseFileSchema } from "@/gateway/schemas/callback";
 import { logger } from "@/packages/logger";
 
+// Characters stripped from workspace/request id path components
+const UNSAFE_PATH_CHARS = /[^a-zA-Z0-9_-]/g;
+
+// Matches path components that are already clean, so sanitizing can skip the replace
+const SAFE_PATH_COMPONENT = /^[a-zA-Z0-9_-]*$/;
+
 /**
  * Configuration for ResponseFileReader
  */
@@ -30,6 +36,9 @@ export enum FileReadErrorType {
  * Custom error for file reading failures
  */
 export class FileReadError extends Error {
+	/** Whether another read attempt may succeed; only unclassified failures are retried */
+	public readonly retryable: boolean;
+
 	constructor(
 		public type: FileReadErrorType,
 		message: string,
@@ -37,6 +46,7 @@ export class FileReadError extends Error {
 	) {
 		super(message);
 		this.name = "FileReadError";
+		this.retryable = type === FileReadErrorType.UNKNOWN;
 	}
 }
 
@@ -115,17 +125,8 @@ export class ResponseFileReader {
 				lastError = err as Error;
 
 				// Don't retry on certain errors
-				if (err instanceof FileReadError) {
-					switch (err.type) {
-						case FileReadErrorType.NOT_FOUND:
-						case FileReadErrorType.PERMISSION_DENIED:
-						case FileReadErrorType.TOO_LARGE:
-						case FileReadErrorType.INVALID_JSON:
-						case FileReadErrorType.SCHEMA_VALIDATION_FAILED:
-						case FileReadErrorType.DIRECTORY_TRAVERSAL:
-							// These are non-retriable errors
-							throw err;
-					}
+				if (err instanceof FileReadError && !err.retryable) {
+					throw err;
 				}
 
 				logger.warn(
@@ -254,9 +255,14 @@ export class ResponseFileReader {
 	 * Removes any characters that aren't alphanumeric, underscore, or hyphen
 	 */
 	private sanitizePath(input: string): string {
+		// Workspace names and request ids are normally already clean; skip the regex for them
+		if (SAFE_PATH_COMPONENT.test(input)) {
+			return input;
+		}
+
 		// Remove any path separators and special characters
 		// Only allow alphanumeric, underscore, and hyphen
-		return input.replace(/[^a-zA-Z0-9_-]/g, "");
+		return input.replace(UNSAFE_PATH_CHARS, "");
 	}
 
 	/**
@@ -53,6 +53,8 @@ export class DiscoveryCacheService {
 	private cache: DiscoveryCache | null = null;
 	private cachePath: string;
 	private pluginsCachePath: string;
+	private inflightRefresh: Promise<DiscoveryCache> | null = null;
+	private queuedRefresh: Promise<DiscoveryCache> | null = null;
 
 	constructor(cachePath: string = CACHE_PATH, pluginsCachePath: string = PLUGINS_CACHE_PATH) {
 		this.cachePath = cachePath;
@@ -63,8 +65,11 @@ export class DiscoveryCacheService {
 	 * Get cached discovery data, refreshing if needed
 	 */
 	async getCache(forceRefresh = false): Promise<DiscoveryCache> {
-		if (!this.cache || forceRefresh) {
+		if (forceRefresh) {
 			await this.refresh();
+		} else if (!this.cache) {
+			// Any completed scan will do for a cold lookup, so join one already running
+			await (this.inflightRefresh ?? this.refresh());
 		}
 		return this.cache as DiscoveryCache;
 	}
@@ -225,16 +230,34 @@ export class DiscoveryCacheService {
 	}
 
 	/**
-	 * Refresh the discovery cache by rescanning all plugins
+	 * Refresh the discovery cache by rescanning all plugins. A caller arriving
+	 * while a rescan is running may be reacting to a plugin change that scan has
+	 * already passed, so one follow-up rescan is queued behind it; every late
+	 * caller shares that follow-up rather than each scanning and writing again.
 	 */
-	async refresh(): Promise<DiscoveryCache> {
+	refresh(): Promise<DiscoveryCache> {
+		if (!this.inflightRefresh) {
+			this.inflightRefresh = this.rebuild().finally(() => {
+				this.inflightRefresh = null;
+			});
+			return this.inflightRefresh;
+		}
+
+		if (!this.queuedRefresh) {
+			const runQueued = () => {
+				this.queuedRefresh = null;
+				return this.refresh();
+			};
+			this.queuedRefresh = this.inflightRefresh.then(runQueued, runQueued);
+		}
+		return this.queuedRefresh;
+	}
+
+	private async rebuild(): Promise<DiscoveryCache> {
 		logger.info("Refreshing discovery cache");
 
 		// Ensure cache directory exists
-		const cacheDir = path.dirname(this.cachePath);
-		if (!fs.existsSync(cacheDir)) {
-			fs.mkdirSync(cacheDir, { recursive: true });
-		}
+		await fs.promises.mkdir(path.dirname(this.cachePath), { recursive: true });
 
 		// Scan all plugins
 		const { agents, commands, skills } = await this.scanPlugins();
@@ -248,10 +271,14 @@ export class DiscoveryCacheService {
 			version: "1.0",
 		};
 
-		// Write to file
-		fs.writeFileSync(this.cachePath, JSON.stringify(this.cache, null, 2), "utf-8");
+		// Write to file without blocking the event loop; serialize once and reuse it for the size log.
+		// Atomic write with temp file so a crash mid-write never leaves a truncated cache behind
+		const payload = JSON.stringify(this.cache, null, 2);
+		const tmpPath = `${this.cachePath}.tmp`;
+		await fs.promises.writeFile(tmpPath, payload, "utf-8");
+		await fs.promises.rename(tmpPath, this.cachePath);
 
-		logger.info({ path: this.cachePath, size: JSON.stringify(this.cache).length }, "Discovery cache updated");
+		logger.info({ path: this.cachePath, size: payload.length }, "Discovery cache updated");
 
 		return this.cache;
 	}
@@ -58,6 +58,12 @@ interface TmuxErrorContext {
 	cause?: unknown;
 }
 
+// Characters replaced with "_" when building tmux session names
+const SESSION_NAME_UNSAFE_CHARS = /[^a-zA-Z0-9_-]/g;
+
+// Session names memoized per (workspace, chatId); bounded since mini-app runs mint one-off chat ids
+const SESSION_NAME_CACHE_LIMIT = 1024;
+
 /**
  * Custom error class for TmuxManager operations
  */
@@ -101,6 +107,7 @@ export class TmuxManager {
 	private stopping: boolean = false;
 	private readonly DEFAULT_SEND_TIMEOUT = 5000; // 5 seconds for send commands
 	private readonly syncLock = new Mutex();
+	private readonly sessionNames: Map<string, string> = new Map();
 
 	constructor(config?: TmuxManagerConfig) {
 		this.config = {
@@ -312,9 +319,23 @@ export class TmuxManager {
 	 * Protected for testability
 	 */
 	protected generateSessionName(workspace: string, chatId: string | number): string {
-		const sanitizedWorkspace = workspace.replace(/[^a-zA-Z0-9_-]/g, "_");
-		const sanitizedChatId = String(chatId).replace(/[^a-zA-Z0-9_-]/g, "_");
-		return `${GATEWAY_CONSTANTS.TMUX.SESSION_PREFIX}${GATEWAY_CONSTANTS.TMUX.SESSION_NAME_SEPARATOR}${sanitizedWorkspace}${GATEWAY_CONSTANTS.TMUX.SESSION_NAME_SEPARATOR}${sanitizedChatId}`;
+		const key = `${workspace}\0${chatId}`;
+		const cached = this.sessionNames.get(key);
+		if (cached) {
+			return cached;
+		}
+
+		const sanitizedWorkspace = workspace.replace(SESSION_NAME_UNSAFE_CHARS, "_");
+		const sanitizedChatId = String(chatId).replace(SESSION_NAME_UNSAFE_CHARS, "_");
+		const sessionName = `${GATEWAY_CONSTANTS.TMUX.SESSION_PREFIX}${GATEWAY_CONSTANTS.TMUX.SESSION_NAME_SEPARATOR}${sanitizedWorkspace}${GATEWAY_CONSTANTS.TMUX.SESSION_NAME_SEPARATOR}${sanitizedChatId}`;
+
+		// Evict the oldest entry once full; Map iterates in insertion order
+		if (this.sessionNames.size >= SESSION_NAME_CACHE_LIMIT) {
+			const oldest = this.sessionNames.keys().next().value;
+			if (oldest !== undefined) this.sessionNames.delete(oldest);
+		}
+		this.sessionNames.set(key, sessionName);
+		return sessionName;
 	}
 
 	private isEphemeralMiniAppSession(sessionName: string): boolean {
@@ -381,31 +402,37 @@ export class TmuxManager {
 
 		logger.info({ containerId, sessionName, workspace, chatId }, "Performing soft reset (compact)");
 
-		// Send /compact command to the AI in the session
+		// Send /compact command to the AI in the session, then clear tmux scrollback buffer.
+		// Both run as one tmux command sequence (";" separator) so the reset costs a single docker exec
 		const compactCommand = this.quoteForShell("/compact");
-		const { exitCode: sendExitCode } = await this.execInContainer(containerId, [
+		const { exitCode: resetExitCode } = await this.execInContainer(containerId, [
 			"tmux",
 			"send-keys",
 			"-t",
 			sessionName,
 			compactCommand,
 			"Enter",
-		]);
-
-		if (sendExitCode !== 0) {
-			logger.warn({ containerId, sessionName }, "Failed to send /compact command during soft reset");
-		}
-
-		// Clear tmux scrollback buffer
-		const { exitCode: clearExitCode } = await this.execInContainer(containerId, [
-			"tmux",
+			";",
 			"clear-history",
 			"-t",
 			sessionName,
 		]);
 
-		if (clearExitCode !== 0) {
-			logger.warn({ containerId, sessionName }, "Failed to clear tmux history during soft reset");
+		if (resetExitCode !== 0) {
+			// tmux abandons a command sequence at the first failing command, so a failed send-keys
+			// would skip clear-history; retry the clear on its own to tell which step failed
+			const { exitCode: clearExitCode } = await this.execInContainer(containerId, [
+				"tmux",
+				"clear-history",
+				"-t",
+				sessionName,
+			]);
+
+			if (clearExitCode === 0) {
+				logger.warn({ containerId, sessionName }, "Failed to send /compact command during soft reset");
+			} else {
+				logger.warn({ containerId, sessionName }, "Failed to clear tmux history during soft reset");
+			}
 		}
 
 		// Mark metadata as reset
@@ -120,6 +120,7 @@ describe("AgentBot", () => {
 		const handled = await bot.handle(baseMessage);
 		expect(handled).toBe(true);
 		expect(calls.at(-1)?.text).toContain("No running Claude instance found");
+		expect(instanceManager.refresh).toHaveBeenCalledTimes(3);
 	});
 
 	test("handle rejects invalid prompt after command routing", async () => {
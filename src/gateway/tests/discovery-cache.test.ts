@@ -211,6 +211,7 @@ Agent body`,
 
 		const persistedRaw = await readFile(cachePath, "utf-8");
 		expect(() => JSON.parse(persistedRaw)).not.toThrow();
+		await expect(readFile(`${cachePath}.tmp`, "utf-8")).rejects.toThrow();
 
 		const loaded = await service.loadFromDisk();
 		expect(loaded?.agents[0].name).toBe("cached-agent");
@@ -219,6 +220,48 @@ Agent body`,
 		await expect(service.loadFromDisk()).resolves.toBeNull();
 	});
 
+	test("concurrent cold getCache calls share one plugin scan", async () => {
+		const service = new DiscoveryCacheService(cachePath, pluginsCachePath);
+		const scanSpy = spyOn(service, "scanPlugins");
+
+		const [first, second] = await Promise.all([service.getCache(), service.getCache()]);
+		expect(scanSpy).toHaveBeenCalledTimes(1);
+		expect(second).toBe(first);
+
+		await service.refresh();
+		expect(scanSpy).toHaveBeenCalledTimes(2);
+	});
+
+	test("refresh requested mid-rebuild queues one follow-up scan that sees the later state", async () => {
+		const service = new DiscoveryCacheService(cachePath, pluginsCachePath);
+		const agent = { name: "late-agent", plugin: "p", version: "1.0.0", description: "", path: "/p/late-agent.md" };
+		let finishFirstScan: () => void = () => {};
+		const scanSpy = spyOn(service, "scanPlugins")
+			.mockImplementationOnce(
+				() =>
+					new Promise((resolve) => {
+						finishFirstScan = () => resolve({ agents: [], commands: [], skills: [] });
+					}),
+			)
+			.mockImplementation(async () => ({ agents: [agent], commands: [], skills: [] }));
+
+		const first = service.refresh();
+		const second = service.refresh();
+		const third = service.refresh();
+		// rebuild() creates the cache directory before scanning; wait until the first scan is pending
+		while (scanSpy.mock.calls.length === 0) {
+			await Bun.sleep(1);
+		}
+		expect(scanSpy).toHaveBeenCalledTimes(1);
+
+		finishFirstScan();
+		expect((await first).agents).toEqual([]);
+		const followUp = await second;
+		expect(followUp.agents).toEqual([agent]);
+		expect(await third).toBe(followUp);
+		expect(scanSpy).toHaveBeenCalledTimes(2);
+	});
+
 	test("getCache reuses in-memory cache unless forceRefresh is true", async () => {
 		const service = new DiscoveryCacheService(cachePath, pluginsCachePath);
 		const refreshSpy = spyOn(service, "refresh");
@@ -2,6 +2,7 @@ import { afterEach, beforeEach, describe, expect, test } from "bun:test";
 import fs from "node:fs/promises";
 import os from "node:os";
 import path from "node:path";
+import { resolveWorkspacePath as resolveGatewayWorkspacePath } from "@/gateway/engine/tools/utils";
 import { resolveWorkspacePath } from "@/packages/agent";
 
 describe("tools/utils", () => {
@@ -83,4 +84,33 @@ describe("tools/utils", () => {
 		const result = await resolveWorkspacePath(testWorkspace, "existing.txt");
 		expect(result).toBe(filePath);
 	});
+
+	test("resolveWorkspacePath - workspace reached through a symlink accepts its files", async () => {
+		const filePath = path.join(testWorkspace, "linked.txt");
+		await fs.writeFile(filePath, "content");
+		const linkedWorkspace = `${testWorkspace}-link`;
+		await fs.symlink(testWorkspace, linkedWorkspace);
+
+		try {
+			expect(await resolveWorkspacePath(linkedWorkspace, "linked.txt")).toBe(filePath);
+			expect(await resolveWorkspacePath(linkedWorkspace, "new-file.txt")).toBe(
+				path.join(linkedWorkspace, "new-file.txt"),
+			);
+		} finally {
+			await fs.rm(linkedWorkspace, { force: true });
+		}
+	});
+
+	test("resolveWorkspacePath - new file whose parent escapes through a symlink is rejected", async () => {
+		const outsideDir = await fs.mkdtemp(path.join(os.tmpdir(), "outside-"));
+		await fs.symlink(outsideDir, path.join(testWorkspace, "escape"));
+
+		try {
+			for (const resolve of [resolveWorkspacePath, resolveGatewayWorkspacePath]) {
+				await expect(resolve(testWorkspace, "escape/new-file.txt")).rejects.toThrow("via symlink");
+			}
+		} finally {
+			await fs.rm(outsideDir, { recursive: true, force: true });
+		}
+	});
 });
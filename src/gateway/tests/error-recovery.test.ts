@@ -1,4 +1,4 @@
-import { afterEach, beforeEach, describe, expect, test } from "bun:test";
+import { afterEach, beforeEach, describe, expect, spyOn, test } from "bun:test";
 import { mkdir, rm } from "node:fs/promises";
 import path from "node:path";
 import {
@@ -195,6 +195,33 @@ describe("ErrorRecoveryService", () => {
 			service.clearForceFailures();
 		});
 
+		test("should open circuit on a sustained failure rate despite interleaved successes", async () => {
+			const threshold = service.getRecoveryStrategies().get(ErrorType.STOP_HOOK).circuitBreakerThreshold; // 5
+			const context = {
+				errorType: ErrorType.STOP_HOOK,
+				requestId: "req-rate-trip",
+				workspace: "test",
+				error: new Error("Hook failed"),
+				attemptCount: 1,
+			};
+
+			const nowSpy = spyOn(Date, "now").mockReturnValue(1_700_000_000_000);
+			for (let i = 0; i < threshold; i++) {
+				// Each success resets the consecutive failure counter, but not the decayed rate
+				service.forceFailure(ErrorType.STOP_HOOK);
+				await service.handleError(context);
+				service.clearForceFailures();
+				if (i < threshold - 1) {
+					expect(await service.handleError(context)).toBe(true);
+				}
+			}
+
+			expect(service.getStats()[ErrorType.STOP_HOOK]?.circuitOpen).toBe(true);
+			expect(await service.handleError(context)).toBe(false);
+
+			nowSpy.mockRestore();
+		});
+
 		test("should track failures per error type independently", async () => {
 			// Force both types to fail
 			service.forceFailure(ErrorType.PERMISSION);
@@ -513,6 +540,30 @@ describe("ErrorRecoveryService", () => {
 			service.clearForceFailures();
 		});
 
+		test("should decay failure rate exponentially between failures", async () => {
+			service.forceFailure(ErrorType.PERMISSION);
+			const context = {
+				errorType: ErrorType.PERMISSION,
+				requestId: "req-rate",
+				workspace: "test",
+				error: new Error("Failed"),
+				attemptCount: 1,
+				metadata: { filePath: path.join(testDir, "test.txt") },
+			};
+
+			const start = 1_700_000_000_000;
+			const nowSpy = spyOn(Date, "now").mockReturnValue(start);
+			await service.handleError(context);
+			await service.handleError(context);
+			expect(service.getStats()[ErrorType.PERMISSION]?.failureRate).toBeCloseTo(2);
+
+			nowSpy.mockReturnValue(start + 60000);
+			expect(service.getStats()[ErrorType.PERMISSION]?.failureRate).toBeCloseTo(2 / Math.E);
+
+			nowSpy.mockRestore();
+			service.clearForceFailures();
+		});
+
 		test("should return empty object for no failures", () => {
 			const stats = service.getStats();
 			expect(Object.keys(stats)).toHaveLength(0);
@@ -708,6 +759,24 @@ describe("ErrorRecoveryService", () => {
 			expect(service.eventNames()).toEqual([]);
 		});
 
+		test("should jitter retry backoff below its capped exponential delay", () => {
+			const backoffDelay = (strategy: RecoveryStrategy, attempt: number) =>
+				(
+					service as unknown as { backoffDelay: (s: RecoveryStrategy, a: number) => number }
+				).backoffDelay(strategy, attempt);
+			const strategy = { maxRetries: 10, backoffMs: 1000 };
+
+			const randomSpy = spyOn(Math, "random").mockReturnValue(0);
+			expect(backoffDelay(strategy, 1)).toBe(500);
+			expect(backoffDelay(strategy, 3)).toBe(2000);
+
+			randomSpy.mockReturnValue(0.999999);
+			expect(backoffDelay(strategy, 3)).toBeLessThan(4000);
+			expect(backoffDelay(strategy, 10)).toBeLessThanOrEqual(30000);
+
+			randomSpy.mockRestore();
+		});
+
 		test("should reset expired circuit breakers", () => {
 			const breakers = service.getCircuitBreakers();
 			const oldFailure = Date.now() - 10 * 60 * 1000;
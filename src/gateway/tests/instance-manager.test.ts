@@ -3,6 +3,31 @@ import fs from "node:fs";
 import { GATEWAY_CONSTANTS } from "@/gateway/consts";
 import { InstanceManager } from "@/gateway/instance-manager";
 
+type SpawnResult = ReturnType<typeof Bun.spawn>;
+
+// Minimal Bun.spawn result whose stdout yields the given docker ps output
+function dockerPsProcess(output: string): SpawnResult {
+	return {
+		stdout: new ReadableStream({
+			start(controller) {
+				controller.enqueue(new TextEncoder().encode(output));
+				controller.close();
+			},
+		}),
+		exited: Promise.resolve(0),
+	} as unknown as SpawnResult;
+}
+
+function dockerPsRows(...rows: unknown[]): string {
+	return rows.map((row) => `${JSON.stringify(row)}\n`).join("");
+}
+
+// Pins docker binary resolution to a fake path so tests do not depend on the host
+function useFakeDockerBinary() {
+	process.env.DOCKER_BIN = "/bin/docker";
+	return spyOn(fs, "existsSync").mockImplementation((p) => String(p) === "/bin/docker");
+}
+
 describe("InstanceManager", () => {
 	let manager: InstanceManager;
 
@@ -15,27 +40,18 @@ describe("InstanceManager", () => {
 	});
 
 	test("should refresh instances from docker ps", async () => {
-		const mockOutput = JSON.stringify({
-			ID: "container123",
-			Names: "claude-test",
-			Status: "Up 2 hours",
-			Labels: "cc-bridge.workspace=claude", // Use 'claude' as expected if it's default
-			Image: "cc-bridge",
-		});
-
 		// Mock Bun.spawn for docker ps
-		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue({
-			stdout: new ReadableStream({
-				start(controller) {
-					controller.enqueue(new TextEncoder().encode(`${mockOutput}\n`));
-					controller.close();
-				},
-			}),
-		} as unknown as {
-			stdout: ReadableStream;
-			stderr: ReadableStream;
-			exited: Promise<number>;
-		});
+		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue(
+			dockerPsProcess(
+				dockerPsRows({
+					ID: "container123",
+					Names: "claude-test",
+					Status: "Up 2 hours",
+					Labels: "cc-bridge.workspace=claude", // Use 'claude' as expected if it's default
+					Image: "cc-bridge",
+				}),
+			),
+		);
 
 		const instances = await manager.refresh();
 		expect(instances.length).toBe(1);
@@ -44,6 +60,108 @@ describe("InstanceManager", () => {
 		spawnSpy.mockRestore();
 	});
 
+	test("should pick the workspace label out of a multi-label column", async () => {
+		const existsSpy = useFakeDockerBinary();
+		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue(
+			dockerPsProcess(
+				dockerPsRows({
+					ID: "id-2",
+					Names: "container-name",
+					Status: "Up 5 minutes",
+					Labels: `com.docker.compose.project=cc,${GATEWAY_CONSTANTS.INSTANCES.LABEL}=ws-2,maintainer=me`,
+					Image: "img",
+				}),
+			),
+		);
+
+		const instances = await manager.refresh();
+		expect(instances.map((i) => i.name)).toEqual(["ws-2"]);
+
+		const args = spawnSpy.mock.calls[0][0] as string[];
+		const format = args[args.indexOf("--format") + 1];
+		expect(format).not.toBe("{{json .}}");
+		expect(format).toContain('"Labels":{{json .Labels}}');
+
+		existsSpy.mockRestore();
+		spawnSpy.mockRestore();
+	});
+
+	test("should classify status by its leading Up token regardless of case", async () => {
+		const existsSpy = useFakeDockerBinary();
+		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue(
+			dockerPsProcess(
+				dockerPsRows(
+					{ ID: "a", Names: "upper", Status: "Up 3 seconds", Labels: "", Image: "img" },
+					{ ID: "b", Names: "lower", Status: "up 3 seconds", Labels: "", Image: "img" },
+					{ ID: "c", Names: "exited", Status: "Exited (1) 2 minutes ago", Labels: "", Image: "img" },
+					{ ID: "d", Names: "created", Status: "Created", Labels: "", Image: "img" },
+				),
+			),
+		);
+
+		const instances = await manager.refresh();
+		expect(Object.fromEntries(instances.map((i) => [i.name, i.status]))).toEqual({
+			upper: "running",
+			lower: "running",
+			exited: "stopped",
+			created: "stopped",
+		});
+
+		existsSpy.mockRestore();
+		spawnSpy.mockRestore();
+	});
+
+	test("should queue one follow-up docker ps for refresh calls made during a pending scan", async () => {
+		const existsSpy = useFakeDockerBinary();
+		let finishFirstScan: (code: number) => void = () => {};
+		const firstScan = dockerPsProcess(
+			dockerPsRows({ ID: "id-5", Names: "ws-5", Status: "Up 1 minute", Labels: "", Image: "img" }),
+		);
+		(firstScan as unknown as { exited: Promise<number> }).exited = new Promise((resolve) => {
+			finishFirstScan = resolve;
+		});
+		const spawnSpy = spyOn(Bun, "spawn")
+			.mockReturnValueOnce(firstScan)
+			.mockImplementation(() =>
+				dockerPsProcess(
+					dockerPsRows(
+						{ ID: "id-5", Names: "ws-5", Status: "Up 1 minute", Labels: "", Image: "img" },
+						{ ID: "id-6", Names: "ws-6", Status: "Up 1 second", Labels: "", Image: "img" },
+					),
+				),
+			);
+
+		const first = manager.refresh();
+		const second = manager.refresh();
+		const third = manager.refresh();
+		expect(spawnSpy).toHaveBeenCalledTimes(1);
+
+		finishFirstScan(0);
+		expect((await first).map((i) => i.name)).toEqual(["ws-5"]);
+		const followUp = await second;
+		expect(followUp.map((i) => i.name)).toEqual(["ws-5", "ws-6"]);
+		expect(await third).toBe(followUp);
+		expect(spawnSpy).toHaveBeenCalledTimes(2);
+
+		await manager.refresh();
+		expect(spawnSpy).toHaveBeenCalledTimes(3);
+
+		existsSpy.mockRestore();
+		spawnSpy.mockRestore();
+	});
+
+	test("should stop probing docker locations at the first existing binary", async () => {
+		const existsSpy = useFakeDockerBinary();
+		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue(dockerPsProcess(""));
+
+		await manager.refresh();
+		expect(existsSpy).toHaveBeenCalledTimes(1);
+		expect(existsSpy).toHaveBeenCalledWith("/bin/docker");
+
+		existsSpy.mockRestore();
+		spawnSpy.mockRestore();
+	});
+
 	test("should stop retrying discovery when docker cli is missing", async () => {
 		const spawnSpy = spyOn(Bun, "spawn").mockImplementation(() => {
 			throw Object.assign(new Error("docker not found"), { code: "ENOENT", path: "docker", errno: -2 });
@@ -59,26 +177,129 @@ describe("InstanceManager", () => {
 	});
 
 	test("should report parse metrics when docker output contains invalid lines", async () => {
-		process.env.DOCKER_BIN = "/bin/docker";
-		const existsSpy = spyOn(fs, "existsSync").mockImplementation((p) => String(p) === "/bin/docker");
-		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue({
+		const existsSpy = useFakeDockerBinary();
+		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue(dockerPsProcess("not-json\n"));
+
+		await manager.refresh();
+		const metrics = manager.getMetrics();
+		expect(metrics.parseErrorCount).toBeGreaterThan(0);
+		expect(metrics.errorRate).toBeGreaterThan(0);
+
+		existsSpy.mockRestore();
+		spawnSpy.mockRestore();
+	});
+
+	test("should tolerate rows missing optional columns and count rows missing ids", async () => {
+		const existsSpy = useFakeDockerBinary();
+		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue(
+			dockerPsProcess(dockerPsRows({ ID: "id-3", Names: "bare" }, { Names: "no-id" }, null)),
+		);
+
+		const instances = await manager.refresh();
+		expect(instances).toEqual([{ name: "bare", containerId: "id-3", status: "stopped", image: "" }]);
+		expect(manager.getMetrics().parseErrorCount).toBe(2);
+
+		existsSpy.mockRestore();
+		spawnSpy.mockRestore();
+	});
+
+	test("should reuse unchanged rows and only create IPC directories on first discovery", async () => {
+		const existsSpy = useFakeDockerBinary();
+		const row = { ID: "id-4", Names: "ws-4", Status: "Up 1 minute", Labels: "", Image: "img" };
+		const spawnSpy = spyOn(Bun, "spawn")
+			.mockReturnValueOnce(dockerPsProcess(dockerPsRows(row)))
+			.mockReturnValueOnce(dockerPsProcess(dockerPsRows(row)));
+		const mkdirSpy = spyOn(fs.promises, "mkdir").mockResolvedValue(undefined);
+
+		const [first] = await manager.refresh();
+		const [second] = await manager.refresh();
+
+		expect(spawnSpy).toHaveBeenCalledTimes(2);
+		expect(mkdirSpy).toHaveBeenCalledTimes(3);
+		expect(second).toBe(first);
+		expect(Object.isFrozen(first)).toBe(true);
+
+		existsSpy.mockRestore();
+		spawnSpy.mockRestore();
+		mkdirSpy.mockRestore();
+	});
+
+	test("should refresh once per docker event chunk while watching", async () => {
+		const existsSpy = useFakeDockerBinary();
+		const eventsProcess = {
 			stdout: new ReadableStream({
 				start(controller) {
-					controller.enqueue(new TextEncoder().encode("not-json\n"));
+					controller.enqueue(new TextEncoder().encode("start\ndie\n"));
 					controller.close();
 				},
 			}),
 			exited: Promise.resolve(0),
-		} as unknown as {
-			stdout: ReadableStream;
-			stderr: ReadableStream;
-			exited: Promise<number>;
-		});
+			kill: () => {},
+		} as unknown as SpawnResult;
+		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue(eventsProcess);
+		const refreshSpy = spyOn(manager, "refresh").mockResolvedValue([]);
 
-		await manager.refresh();
-		const metrics = manager.getMetrics();
-		expect(metrics.parseErrorCount).toBeGreaterThan(0);
-		expect(metrics.errorRate).toBeGreaterThan(0);
+		const stop = manager.watch();
+		const args = spawnSpy.mock.calls[0][0] as string[];
+		expect(args.slice(0, 2)).toEqual(["/bin/docker", "events"]);
+		expect(args).toContain(`label=${GATEWAY_CONSTANTS.INSTANCES.LABEL}`);
+
+		await Bun.sleep(0);
+		expect(refreshSpy).toHaveBeenCalledTimes(1);
+		expect(manager.isWatching()).toBe(false);
+
+		stop();
+		existsSpy.mockRestore();
+		spawnSpy.mockRestore();
+		refreshSpy.mockRestore();
+	});
+
+	test("should retry an event-triggered refresh whose docker ps failed", async () => {
+		const existsSpy = useFakeDockerBinary();
+		let closeEvents: () => void = () => {};
+		const eventsProcess = {
+			stdout: new ReadableStream({
+				start(controller) {
+					controller.enqueue(new TextEncoder().encode("start\n"));
+					closeEvents = () => controller.close();
+				},
+			}),
+			exited: Promise.resolve(0),
+			kill: () => closeEvents(),
+		} as unknown as SpawnResult;
+		const failedScan = dockerPsProcess("");
+		(failedScan as unknown as { exited: Promise<number> }).exited = Promise.resolve(1);
+		const spawnSpy = spyOn(Bun, "spawn")
+			.mockReturnValueOnce(eventsProcess)
+			.mockReturnValueOnce(failedScan)
+			.mockImplementation(() =>
+				dockerPsProcess(dockerPsRows({ ID: "id-7", Names: "ws-7", Status: "Up 1 second", Labels: "", Image: "img" })),
+			);
+		const mkdirSpy = spyOn(fs.promises, "mkdir").mockResolvedValue(undefined);
+		(manager as unknown as { eventRetryDelayMs: number }).eventRetryDelayMs = 0;
+
+		const stop = manager.watch();
+		await Bun.sleep(20);
+
+		expect(spawnSpy).toHaveBeenCalledTimes(3);
+		expect(manager.getInstance("ws-7")?.containerId).toBe("id-7");
+		expect(manager.isWatching()).toBe(true);
+
+		stop();
+		existsSpy.mockRestore();
+		spawnSpy.mockRestore();
+		mkdirSpy.mockRestore();
+	});
+
+	test("should not start a watcher when docker cli is unavailable", () => {
+		process.env.DOCKER_BIN = "/missing/docker";
+		const existsSpy = spyOn(fs, "existsSync").mockReturnValue(false);
+		const spawnSpy = spyOn(Bun, "spawn");
+
+		const stop = manager.watch();
+		expect(spawnSpy).not.toHaveBeenCalled();
+		expect(manager.isWatching()).toBe(false);
+		stop();
 
 		existsSpy.mockRestore();
 		spawnSpy.mockRestore();
@@ -106,31 +327,18 @@ describe("InstanceManager", () => {
 	});
 
 	test("should expose discovered instances via getters", async () => {
-		process.env.DOCKER_BIN = "/bin/docker";
-		const existsSpy = spyOn(fs, "existsSync").mockImplementation((p) => String(p) === "/bin/docker");
-		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue({
-			stdout: new ReadableStream({
-				start(controller) {
-					controller.enqueue(
-						new TextEncoder().encode(
-							`${JSON.stringify({
-								ID: "id-1",
-								Names: "ws-1",
-								Status: "Up 1 minute",
-								Labels: `${GATEWAY_CONSTANTS.INSTANCES.LABEL}=ws-1`,
-								Image: "img",
-							})}\n`,
-						),
-					);
-					controller.close();
-				},
-			}),
-			exited: Promise.resolve(0),
-		} as unknown as {
-			stdout: ReadableStream;
-			stderr: ReadableStream;
-			exited: Promise<number>;
-		});
+		const existsSpy = useFakeDockerBinary();
+		const spawnSpy = spyOn(Bun, "spawn").mockReturnValue(
+			dockerPsProcess(
+				dockerPsRows({
+					ID: "id-1",
+					Names: "ws-1",
+					Status: "Up 1 minute",
+					Labels: `${GATEWAY_CONSTANTS.INSTANCES.LABEL}=ws-1`,
+					Image: "img",
+				}),
+			),
+		);
 
 		await manager.refresh();
 		expect(manager.getInstances()).toHaveLength(1);
@@ -61,6 +61,26 @@ describe("RateLimiter", () => {
 			expect(retryAfter).toBeGreaterThan(0);
 		});
 
+		test("should reopen the window as the oldest request expires", async () => {
+			const start = 1_700_000_000_000;
+			const nowSpy = spyOn(Date, "now").mockReturnValue(start);
+			const rlInternal = rateLimiter as unknown as RateLimiterInternals;
+
+			expect(await rateLimiter.isAllowed("user-1")).toBe(true);
+			nowSpy.mockReturnValue(start + 30_000);
+			expect(await rateLimiter.isAllowed("user-1")).toBe(true);
+			expect(await rateLimiter.isAllowed("user-1")).toBe(true);
+			expect(await rateLimiter.isAllowed("user-1")).toBe(false);
+			const timestamps = rlInternal.requests.get("user-1");
+
+			nowSpy.mockReturnValue(start + 60_000);
+			expect(await rateLimiter.isAllowed("user-1")).toBe(true);
+			expect(rlInternal.requests.get("user-1")).toBe(timestamps);
+			expect(timestamps).toEqual([start + 30_000, start + 30_000, start + 60_000]);
+
+			nowSpy.mockRestore();
+		});
+
 		test("should handle numeric chat IDs", async () => {
 			const chatId = 12345;
 
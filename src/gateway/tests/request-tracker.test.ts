@@ -1,5 +1,5 @@
 import { afterEach, beforeEach, describe, expect, test } from "bun:test";
-import { rm } from "node:fs/promises";
+import { readFile, rm } from "node:fs/promises";
 import path from "node:path";
 import { RequestTracker } from "@/gateway/services/RequestTracker";
 
@@ -175,6 +175,37 @@ describe("RequestTracker", () => {
 			expect(wsB[0].requestId).toBe("req-list-b1");
 		});
 
+		test("should persist compact state without null fields", async () => {
+			await tracker.createRequest({
+				requestId: "req-compact",
+				chatId: "123",
+				workspace: "compact-workspace",
+			});
+			await tracker.updateState("req-compact", { state: "failed", error: null as unknown as string });
+
+			const raw = await readFile(path.join(testStateDir, "requests", "req-compact.json"), "utf-8");
+			expect(raw).not.toContain("\n");
+			expect(JSON.parse(raw)).not.toHaveProperty("error");
+			expect(JSON.parse(raw).state).toBe("failed");
+		});
+
+		test("should serve listRequests from cache without caching listed files", async () => {
+			const created = await tracker.createRequest({
+				requestId: "req-list-cached",
+				chatId: "123",
+				workspace: "cached-workspace",
+			});
+
+			const [listed] = await tracker.listRequests("cached-workspace");
+			expect(listed).toEqual(created);
+			expect(listed).not.toBe(created);
+
+			// A second tracker over the same state dir has nothing cached; listing must not fill its cache
+			const reader = new RequestTracker({ stateBaseDir: testStateDir });
+			expect(await reader.listRequests("cached-workspace")).toEqual([created]);
+			expect(reader.getStats().totalCached).toBe(0);
+		});
+
 		test("should filter requests by state", async () => {
 			await tracker.createRequest({
 				requestId: "req-filter-001",
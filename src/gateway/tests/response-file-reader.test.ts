@@ -99,6 +99,12 @@ describe("ResponseFileReader", () => {
 		}
 	});
 
+	test("should only mark unclassified read errors as retryable", () => {
+		for (const type of Object.values(FileReadErrorType)) {
+			expect(new FileReadError(type, "failed").retryable).toBe(type === FileReadErrorType.UNKNOWN);
+		}
+	});
+
 	test("should throw INVALID_JSON for malformed JSON", async () => {
 		await writeFile(path.join(testDir, "test-workspace", "responses", "bad-json.json"), "{ invalid json }");
 
@@ -308,6 +314,14 @@ describe("ResponseFileReader", () => {
 		}
 	});
 
+	test("should pass clean path components through and strip unsafe characters", () => {
+		const internals = reader as unknown as { sanitizePath: (input: string) => string };
+
+		expect(internals.sanitizePath("Work_space-01")).toBe("Work_space-01");
+		expect(internals.sanitizePath("")).toBe("");
+		expect(internals.sanitizePath("../req 01/é")).toBe("req01");
+	});
+
 	test("should sanitize workspace and requestId", async () => {
 		// "test-workspace/../../etc" -> "test-workspaceetc" (dots/slashes removed, hyphens kept)
 		// "sanitized-001../../../passwd" -> "sanitized-001passwd" (dots/slashes removed)
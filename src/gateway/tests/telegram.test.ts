@@ -4,6 +4,18 @@ import { TelegramChannel, TelegramClient } from "@/gateway/channels/telegram";
 // Mock fetch globally
 const originalFetch = globalThis.fetch;
 
+// Webhook fixtures shared read-only across parseWebhook tests
+const TEST_CHAT = Object.freeze({ id: 12345, type: "private" });
+const TEST_USER = Object.freeze({ id: 789, username: "testuser" });
+
+// Canned JSON bodies for Bot API methods whose mock response does not depend on the request
+const STATIC_OK_BODIES: Readonly<Record<string, unknown>> = Object.freeze({
+	sendChatAction: { ok: true },
+	setMyCommands: { ok: true },
+	editMessageText: { ok: true },
+	getWebhookInfo: { ok: true, result: { url: "https://test.com" } },
+});
+
 describe("TelegramChannel", () => {
 	let telegram: TelegramChannel;
 	const testBotToken = "test-token-12345";
@@ -30,34 +42,11 @@ describe("TelegramChannel", () => {
 				} as Response;
 			}
 
-			if (url.includes("sendChatAction")) {
-				return {
-					ok: true,
-					json: async () => ({ ok: true }),
-					text: async () => "OK",
-				} as Response;
-			}
-
-			if (url.includes("setMyCommands")) {
-				return {
-					ok: true,
-					json: async () => ({ ok: true }),
-					text: async () => "OK",
-				} as Response;
-			}
-
-			if (url.includes("editMessageText")) {
-				return {
-					ok: true,
-					json: async () => ({ ok: true }),
-					text: async () => "OK",
-				} as Response;
-			}
-
-			if (url.includes("getWebhookInfo")) {
+			const staticBody = STATIC_OK_BODIES[url.slice(url.lastIndexOf("/") + 1)];
+			if (staticBody) {
 				return {
 					ok: true,
-					json: async () => ({ ok: true, result: { url: "https://test.com" } }),
+					json: async () => staticBody,
 					text: async () => "OK",
 				} as Response;
 			}
@@ -161,8 +150,8 @@ describe("TelegramChannel", () => {
 				update_id: 123,
 				message: {
 					message_id: 456,
-					from: { id: 789, username: "testuser" },
-					chat: { id: 12345, type: "private" },
+					from: TEST_USER,
+					chat: TEST_CHAT,
 					text: "Hello bot",
 					date: 1640000000,
 				},
@@ -171,11 +160,11 @@ describe("TelegramChannel", () => {
 			const message = telegram.parseWebhook(webhookBody);
 
 			expect(message).not.toBeNull();
-			expect(message?.chatId).toBe(12345);
+			expect(message?.chatId).toBe(TEST_CHAT.id);
 			expect(message?.text).toBe("Hello bot");
 			expect(message?.updateId).toBe(123);
-			expect(message?.user?.id).toBe(789);
-			expect(message?.user?.username).toBe("testuser");
+			expect(message?.user?.id).toBe(TEST_USER.id);
+			expect(message?.user?.username).toBe(TEST_USER.username);
 		});
 
 		test("should return null for webhook without message", () => {
@@ -201,7 +190,7 @@ describe("TelegramChannel", () => {
 				update_id: 123,
 				message: {
 					message_id: 456,
-					chat: { id: 12345, type: "private" },
+					chat: TEST_CHAT,
 					text: "Test",
 				},
 			};
@@ -339,11 +328,12 @@ describe("TelegramChannel", () => {
 				await client.editMessageText(12345, 100, "Hello *world*");
 
 				const editCall = mockCalls.find((c) => c.url.includes("editMessageText"));
-				expect(editCall).toBeDefined();
-				expect(editCall?.body?.chat_id).toBe(12345);
-				expect(editCall?.body?.message_id).toBe(100);
-				expect(editCall?.body?.parse_mode).toBe("MarkdownV2");
-				expect(editCall?.body?.text).toContain("\\*");
+				expect(editCall?.body).toEqual({
+					chat_id: 12345,
+					message_id: 100,
+					text: "Hello \\*world\\*",
+					parse_mode: "MarkdownV2",
+				});
 			});
 
 			test("should pass through custom parse mode without escaping", async () => {
@@ -112,6 +112,17 @@ describe("TmuxManager", () => {
 				expect(tmuxManager.generateSessionName(workspace, chatId)).toBe(expected);
 			}
 		});
+
+		test("should keep the memoized session name cache bounded", () => {
+			const sessionNames = (tmuxManager as unknown as { sessionNames: Map<string, string> }).sessionNames;
+
+			for (let i = 0; i < 1100; i++) {
+				tmuxManager.generateSessionName(TEST_WORKSPACE, `miniapp-${i}`);
+			}
+
+			expect(sessionNames.size).toBe(1024);
+			expect(tmuxManager.generateSessionName(TEST_WORKSPACE, "miniapp-0")).toBe("claude-test-workspace-miniapp-0");
+		});
 	});
 
 	describe("Shell Escaping", () => {
@@ -780,6 +791,38 @@ describe("TmuxManager", () => {
 		});
 	});
 
+	describe("Soft Reset", () => {
+		test("sends /compact and clears history in one tmux command sequence", async () => {
+			const sessionName = tmuxManager.generateSessionName(TEST_WORKSPACE, TEST_CHAT_ID);
+
+			await expect(tmuxManager.softReset(TEST_CONTAINER_ID, TEST_WORKSPACE, TEST_CHAT_ID)).resolves.toBe(true);
+
+			expect(tmuxManager.mockExecInContainer.mock.calls).toEqual([
+				[TEST_CONTAINER_ID, ["tmux", "has-session", "-t", sessionName]],
+				[
+					TEST_CONTAINER_ID,
+					["tmux", "send-keys", "-t", sessionName, "'/compact'", "Enter", ";", "clear-history", "-t", sessionName],
+				],
+			]);
+		});
+
+		test("retries clear-history on its own when the command sequence fails", async () => {
+			const sessionName = tmuxManager.generateSessionName(TEST_WORKSPACE, TEST_CHAT_ID);
+			tmuxManager.mockExecInContainer
+				.mockResolvedValueOnce({ stdout: "", stderr: "", exitCode: 0 })
+				.mockResolvedValueOnce({ stdout: "", stderr: "send failed", exitCode: 1 })
+				.mockResolvedValueOnce({ stdout: "", stderr: "", exitCode: 0 });
+
+			await expect(tmuxManager.softReset(TEST_CONTAINER_ID, TEST_WORKSPACE, TEST_CHAT_ID)).resolves.toBe(true);
+
+			expect(tmuxManager.mockExecInContainer).toHaveBeenCalledTimes(3);
+			expect(tmuxManager.mockExecInContainer.mock.calls[2]).toEqual([
+				TEST_CONTAINER_ID,
+				["tmux", "clear-history", "-t", sessionName],
+			]);
+		});
+	});
+
 	describe("Internal Execution Helpers", () => {
 		test("execInContainer and execInContainerWithStdin parse spawn output", async () => {
 			type TmuxManagerInternals = {
@@ -7,6 +7,11 @@
 import { logger } from "@/packages/logger";
 import { getTierName, type PermissionTier } from "./tiers";
 
+/**
+ * Parameter names containing any of these fragments are redacted (one case-insensitive scan per key)
+ */
+const SENSITIVE_PARAM_PATTERN = /password|token|secret|apikey|credential/i;
+
 /**
  * Result of a tool call
  */
@@ -298,7 +303,6 @@ export class AuditLogger {
 	 * Sanitize parameters to remove sensitive data
 	 */
 	private sanitizeParams(params: Record<string, unknown>): Record<string, unknown> {
-		const sensitiveKeys = ["password", "token", "secret", "apiKey", "credential"];
 		const sanitized: Record<string, unknown> = {};
 
 		for (const [key, value] of Object.entries(params)) {
@@ -306,7 +310,7 @@ export class AuditLogger {
 			if (key.startsWith("__")) continue;
 
 			// Mask sensitive values
-			if (sensitiveKeys.some((sk) => key.toLowerCase().includes(sk))) {
+			if (SENSITIVE_PARAM_PATTERN.test(key)) {
 				sanitized[key] = "[REDACTED]";
 			} else if (typeof value === "object" && value !== null) {
 				sanitized[key] = this.sanitizeParams(value as Record<string, unknown>);
@@ -1,6 +1,6 @@
 import { describe, expect, test } from "bun:test";
 import fs from "node:fs";
-import { ConfigLoader, deepMerge, isRecord } from "@/packages/config/index";
+import { ConfigLoader } from "@/packages/config/index";
 
 describe("ConfigLoader - Coverage", () => {
 	const defaults = {
@@ -41,23 +41,16 @@ describe("ConfigLoader - Coverage", () => {
 		}
 	});
 
-	test("should return defaults for invalid parsed value (lines 22-25)", () => {
-		const testConfigPath = getTestPath("invalid-string");
-		try {
-			fs.writeFileSync(testConfigPath, '"just a string"', "utf-8");
-			const result = ConfigLoader.load(testConfigPath, defaults);
-			expect(result).toEqual(defaults);
-		} finally {
-			cleanup(testConfigPath);
-		}
-	});
+	// Content that parses to a non-object (lines 22-25) or fails to parse (lines 30-31)
+	const fallbackContents: readonly string[] = ['"just a string"', "null", "{ invalid json }"];
 
-	test("should return defaults for null parsed value (lines 22-25)", () => {
-		const testConfigPath = getTestPath("null-value");
+	test("should return defaults for non-object or unparseable content", () => {
+		const testConfigPath = getTestPath("fallback");
 		try {
-			fs.writeFileSync(testConfigPath, "null", "utf-8");
-			const result = ConfigLoader.load(testConfigPath, defaults);
-			expect(result).toEqual(defaults);
+			for (const content of fallbackContents) {
+				fs.writeFileSync(testConfigPath, content, "utf-8");
+				expect(ConfigLoader.load(testConfigPath, defaults)).toEqual(defaults);
+			}
 		} finally {
 			cleanup(testConfigPath);
 		}
@@ -100,17 +93,6 @@ describe("ConfigLoader - Coverage", () => {
 		}
 	});
 
-	test("should handle parse errors gracefully (lines 30-31)", () => {
-		const testConfigPath = getTestPath("parse-error");
-		try {
-			fs.writeFileSync(testConfigPath, "{ invalid json }", "utf-8");
-			const result = ConfigLoader.load(testConfigPath, defaults);
-			expect(result).toEqual(defaults);
-		} finally {
-			cleanup(testConfigPath);
-		}
-	});
-
 	test("should cover deepMerge non-record defaults branch", () => {
 		const testConfigPath = getTestPath("non-record-defaults");
 		try {
@@ -121,20 +103,4 @@ describe("ConfigLoader - Coverage", () => {
 			cleanup(testConfigPath);
 		}
 	});
-
-	test("should expose and validate isRecord helper", () => {
-		expect(isRecord({})).toBe(true);
-		expect(isRecord([])).toBe(false);
-		expect(isRecord(null)).toBe(false);
-		expect(isRecord("x")).toBe(false);
-	});
-
-	test("should deepMerge nested objects recursively", () => {
-		const out = deepMerge({ nested: { a: 1, b: 2 }, top: "x" }, { nested: { b: 3 } });
-		expect(out).toEqual({ nested: { a: 1, b: 3 }, top: "x" });
-	});
-
-	test("should expose functional loader API", () => {
-		expect(typeof ConfigLoader.load).toBe("function");
-	});
 });
@@ -8,6 +8,15 @@ import {
 	type AgentYamlConfig,
 } from "@/packages/agent/core/config-loader";
 
+// Build options shared by every buildAgentConfig test; frozen so tests cannot leak changes into each other
+const BUILD_OPTIONS = Object.freeze({ workspaceDir: "/workspace/test", sessionId: "session-123" });
+
+// Smallest valid agent config; tests spread it and override only the sub-configs they exercise
+const MINIMAL_CONFIG: AgentYamlConfig = Object.freeze({
+	provider: Object.freeze({ default: "anthropic" }),
+	model: Object.freeze({ default: "claude-sonnet-4-6" }),
+});
+
 describe("loadAgentConfig", () => {
 	const testConfigPath = "/tmp/test-agent-config.jsonc";
 
@@ -56,54 +65,28 @@ describe("loadAgentConfig", () => {
 		);
 	});
 
-	test("should throw when provider is missing", () => {
-		const configContent = `{
-			"model": { "default": "claude-sonnet-4-6" }
-		}`;
-		fs.writeFileSync(testConfigPath, configContent, "utf-8");
-
-		expect(() => loadAgentConfig(testConfigPath)).toThrow("Agent config must have a 'provider' object");
-	});
-
-	test("should throw when model is missing", () => {
-		const configContent = `{
-			"provider": { "default": "anthropic" }
-		}`;
-		fs.writeFileSync(testConfigPath, configContent, "utf-8");
-
-		expect(() => loadAgentConfig(testConfigPath)).toThrow("Agent config must have a 'model' object");
-	});
-
-	test("should throw when provider.default is not a string", () => {
-		const configContent = `{
-			"provider": { "default": 123 },
-			"model": { "default": "claude-sonnet-4-6" }
-		}`;
-		fs.writeFileSync(testConfigPath, configContent, "utf-8");
-
-		expect(() => loadAgentConfig(testConfigPath)).toThrow("Provider 'default' must be a string");
-	});
-
-	test("should throw when model.default is not a string", () => {
-		const configContent = `{
-			"provider": { "default": "anthropic" },
-			"model": { "default": false }
-		}`;
-		fs.writeFileSync(testConfigPath, configContent, "utf-8");
-
-		expect(() => loadAgentConfig(testConfigPath)).toThrow("Model 'default' must be a string");
-	});
-
-	test("should throw when config is not an object", () => {
-		fs.writeFileSync(testConfigPath, '"just a string"', "utf-8");
-
-		expect(() => loadAgentConfig(testConfigPath)).toThrow("Agent config must be an object");
-	});
-
-	test("should throw when config is null", () => {
-		fs.writeFileSync(testConfigPath, "null", "utf-8");
-
-		expect(() => loadAgentConfig(testConfigPath)).toThrow("Agent config must be an object");
+	// Config file contents rejected by shape validation, with the error each must raise
+	const invalidConfigs: ReadonlyArray<{ content: string; error: string }> = [
+		{ content: '{ "model": { "default": "claude-sonnet-4-6" } }', error: "Agent config must have a 'provider' object" },
+		{ content: '{ "provider": { "default": "anthropic" } }', error: "Agent config must have a 'model' object" },
+		{
+			content: '{ "provider": { "default": 123 }, "model": { "default": "claude-sonnet-4-6" } }',
+			error: "Provider 'default' must be a string",
+		},
+		{
+			content: '{ "provider": { "default": "anthropic" }, "model": { "default": false } }',
+			error: "Model 'default' must be a string",
+		},
+		{ content: '"just a string"', error: "Agent config must be an object" },
+		{ content: "null", error: "Agent config must be an object" },
+	];
+
+	test("should throw a descriptive error for each invalid config shape", () => {
+		for (const { content, error } of invalidConfigs) {
+			fs.writeFileSync(testConfigPath, content, "utf-8");
+
+			expect(() => loadAgentConfig(testConfigPath)).toThrow(error);
+		}
 	});
 
 	test("should accept valid config with all optional fields", () => {
@@ -121,20 +104,16 @@ describe("loadAgentConfig", () => {
 
 		const config = loadAgentConfig(testConfigPath);
 
-		expect(config.provider.default).toBe("anthropic");
-		expect(config.model.default).toBe("claude-sonnet-4-6");
-		expect(config.model.reasoning).toBe(true);
-		expect(config.tools?.enabled).toBe(true);
-		expect(config.tools?.policy?.default).toBe("read-only");
-		expect(config.sandbox?.mode).toBe("host");
-		expect(config.sandbox?.limits?.memory).toBe("512m");
-		expect(config.memory?.enabled).toBe(true);
-		expect(config.memory?.backend).toBe("builtin");
-		expect(config.rag?.enabled).toBe(true);
-		expect(config.rag?.threshold).toBe(0.3);
-		expect(config.rag?.mode).toBe("hybrid");
-		expect(config.observability?.enabled).toBe(false);
-		expect(config.session?.ttlMs).toBe(1800000);
+		expect(config).toEqual({
+			provider: { default: "anthropic" },
+			model: { default: "claude-sonnet-4-6", reasoning: true },
+			tools: { enabled: true, policy: { default: "read-only" } },
+			sandbox: { mode: "host", limits: { memory: "512m", cpus: 2, pids: 100 } },
+			memory: { enabled: true, backend: "builtin" },
+			rag: { enabled: true, threshold: 0.3, maxResults: 5, mode: "hybrid" },
+			observability: { enabled: false },
+			session: { ttlMs: 1800000, maxSessions: 100 },
+		});
 	});
 
 	test("should handle multi-line comments", () => {
@@ -154,16 +133,8 @@ describe("loadAgentConfig", () => {
 });
 
 describe("buildAgentConfig", () => {
-	const minimalConfig: AgentYamlConfig = {
-		provider: { default: "anthropic" },
-		model: { default: "claude-sonnet-4-6" },
-	};
-
 	test("should build config with minimal config", () => {
-		const result = buildAgentConfig(minimalConfig, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
+		const result = buildAgentConfig(MINIMAL_CONFIG, BUILD_OPTIONS);
 
 		expect(result.sessionId).toBe("session-123");
 		expect(result.workspaceDir).toBe("/workspace/test");
@@ -172,39 +143,29 @@ describe("buildAgentConfig", () => {
 	});
 
 	test("should include workspace from options when provided", () => {
-		const result = buildAgentConfig(minimalConfig, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-			workspace: "my-workspace",
-		});
+		const result = buildAgentConfig(MINIMAL_CONFIG, { ...BUILD_OPTIONS, workspace: "my-workspace" });
 
 		expect(result.workspace).toBeUndefined(); // buildAgentConfig doesn't use workspace
 	});
 
 	test("should build config with model reasoning", () => {
 		const configWithReasoning: AgentYamlConfig = {
-			...minimalConfig,
+			...MINIMAL_CONFIG,
 			model: { default: "claude-sonnet-4-6", reasoning: true },
 		};
 
-		const result = buildAgentConfig(configWithReasoning, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
+		const result = buildAgentConfig(configWithReasoning, BUILD_OPTIONS);
 
 		expect(result.modelReasoning).toBe(true);
 	});
 
 	test("should build RAG config when enabled", () => {
 		const configWithRag: AgentYamlConfig = {
-			...minimalConfig,
+			...MINIMAL_CONFIG,
 			rag: { enabled: true, threshold: 0.5, maxResults: 10, mode: "vector" },
 		};
 
-		const result = buildAgentConfig(configWithRag, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
+		const result = buildAgentConfig(configWithRag, BUILD_OPTIONS);
 
 		expect(result.rag).toEqual({
 			enabled: true,
@@ -216,35 +177,29 @@ describe("buildAgentConfig", () => {
 
 	test("should not include RAG config when disabled", () => {
 		const configWithRagDisabled: AgentYamlConfig = {
-			...minimalConfig,
+			...MINIMAL_CONFIG,
 			rag: { enabled: false },
 		};
 
-		const result = buildAgentConfig(configWithRagDisabled, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
+		const result = buildAgentConfig(configWithRagDisabled, BUILD_OPTIONS);
 
 		expect(result.rag).toBeUndefined();
 	});
 
 	test("should build observability config when enabled", () => {
 		const configWithObservability: AgentYamlConfig = {
-			...minimalConfig,
+			...MINIMAL_CONFIG,
 			observability: { enabled: true },
 		};
 
-		const result = buildAgentConfig(configWithObservability, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
+		const result = buildAgentConfig(configWithObservability, BUILD_OPTIONS);
 
 		expect(result.observability).toEqual({ enabled: true });
 	});
 
 	test("should build OTEL config when enabled in observability", () => {
 		const configWithOtel: AgentYamlConfig = {
-			...minimalConfig,
+			...MINIMAL_CONFIG,
 			observability: {
 				enabled: true,
 				otel: {
@@ -258,10 +213,7 @@ describe("buildAgentConfig", () => {
 			},
 		};
 
-		const result = buildAgentConfig(configWithOtel, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
+		const result = buildAgentConfig(configWithOtel, BUILD_OPTIONS);
 
 		expect(result.otel).toEqual({
 			enabled: true,
@@ -275,118 +227,76 @@ describe("buildAgentConfig", () => {
 
 	test("should not include OTEL config when disabled", () => {
 		const configWithOtelDisabled: AgentYamlConfig = {
-			...minimalConfig,
+			...MINIMAL_CONFIG,
 			observability: {
 				enabled: true,
 				otel: { enabled: false },
 			},
 		};
 
-		const result = buildAgentConfig(configWithOtelDisabled, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
+		const result = buildAgentConfig(configWithOtelDisabled, BUILD_OPTIONS);
 
 		expect(result.otel).toBeUndefined();
 	});
 });
 
 describe("buildAgentConfig - multi-provider strategies", () => {
-	const baseConfig: AgentYamlConfig = {
-		provider: { default: "anthropic" },
-		model: { default: "claude-sonnet-4-6" },
-	};
-
 	test("should return SingleProviderConfig when no multiProvider", () => {
-		const result = buildAgentConfig(baseConfig, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
+		const result = buildAgentConfig(MINIMAL_CONFIG, BUILD_OPTIONS);
 
 		expect(result.provider).toEqual({ name: "anthropic" });
 	});
 
-	test("should build cost-optimized multi-provider config", () => {
-		const config: AgentYamlConfig = {
-			...baseConfig,
-			provider: {
-				default: "anthropic",
-				multiProvider: {
-					strategy: "cost-optimized",
-					maxBudgetPer1kTokens: 0.01,
-				},
-			},
-		};
-
-		const result = buildAgentConfig(config, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
-
-		expect(result.provider).toEqual({
-			providers: [{ name: "anthropic" }],
-			selection: {
-				type: "cost-optimized",
-				maxBudgetPer1kTokens: 0.01,
-			},
-		});
-	});
-
-	test("should build latency-optimized multi-provider config", () => {
-		const config: AgentYamlConfig = {
-			...baseConfig,
-			provider: {
-				default: "anthropic",
-				multiProvider: {
-					strategy: "latency-optimized",
-					maxLatencyMs: 1000,
-				},
-			},
-		};
-
-		const result = buildAgentConfig(config, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
-
-		expect(result.provider).toEqual({
-			providers: [{ name: "anthropic" }],
-			selection: {
-				type: "latency-optimized",
-				maxLatencyMs: 1000,
-			},
-		});
-	});
-
-	test("should build quality-optimized multi-provider config", () => {
-		const config: AgentYamlConfig = {
-			...baseConfig,
-			provider: {
-				default: "anthropic",
-				multiProvider: {
-					strategy: "quality-optimized",
-					preferredProviders: ["anthropic", "openai"],
-				},
-			},
-		};
-
-		const result = buildAgentConfig(config, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
-
-		expect(result.provider).toEqual({
-			providers: [{ name: "anthropic" }],
-			selection: {
-				type: "quality-optimized",
-				preferredProviders: ["anthropic", "openai"],
-			},
-		});
+	// Strategies that keep the default provider as the only candidate, with the selection each one builds
+	const singleProviderStrategies: ReadonlyArray<{
+		multiProvider: NonNullable<AgentYamlConfig["provider"]["multiProvider"]>;
+		selection: Record<string, unknown>;
+	}> = [
+		{
+			multiProvider: { strategy: "cost-optimized", maxBudgetPer1kTokens: 0.01 },
+			selection: { type: "cost-optimized", maxBudgetPer1kTokens: 0.01 },
+		},
+		{
+			multiProvider: { strategy: "latency-optimized", maxLatencyMs: 1000 },
+			selection: { type: "latency-optimized", maxLatencyMs: 1000 },
+		},
+		{
+			multiProvider: { strategy: "quality-optimized", preferredProviders: ["anthropic", "openai"] },
+			selection: { type: "quality-optimized", preferredProviders: ["anthropic", "openai"] },
+		},
+		// Fallback without an order falls back to the default provider
+		{
+			multiProvider: { strategy: "fallback" },
+			selection: { type: "fallback", order: ["anthropic"] },
+		},
+		{
+			multiProvider: { strategy: "smart", weights: { cost: 0.2, latency: 0.3, quality: 0.5 } },
+			selection: { type: "smart", weights: { cost: 0.2, latency: 0.3, quality: 0.5 } },
+		},
+		// Smart without weights uses the default weights
+		{
+			multiProvider: { strategy: "smart" },
+			selection: { type: "smart", weights: { cost: 0.33, latency: 0.33, quality: 0.34 } },
+		},
+	];
+
+	test("should build single-provider selection for each multi-provider strategy", () => {
+		for (const { multiProvider, selection } of singleProviderStrategies) {
+			const config: AgentYamlConfig = {
+				...MINIMAL_CONFIG,
+				provider: { default: "anthropic", multiProvider },
+			};
+
+			expect(buildAgentConfig(config, BUILD_OPTIONS).provider).toEqual({
+				providers: [{ name: "anthropic" }],
+				selection,
+			});
+		}
 	});
 
 	test("should build fallback multi-provider config", () => {
 		const config: AgentYamlConfig = {
-			...baseConfig,
+			...MINIMAL_CONFIG,
 			provider: {
 				default: "anthropic",
 				multiProvider: {
@@ -396,10 +306,7 @@ describe("buildAgentConfig - multi-provider strategies", () => {
 			},
 		};
 
-		const result = buildAgentConfig(config, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
+		const result = buildAgentConfig(config, BUILD_OPTIONS);
 
 		expect(result.provider).toEqual({
 			providers: [{ name: "anthropic" }, { name: "openai" }, { name: "google" }],
@@ -410,85 +317,9 @@ describe("buildAgentConfig - multi-provider strategies", () => {
 		});
 	});
 
-	test("should use default provider when order not specified in fallback", () => {
-		const config: AgentYamlConfig = {
-			...baseConfig,
-			provider: {
-				default: "anthropic",
-				multiProvider: {
-					strategy: "fallback",
-				},
-			},
-		};
-
-		const result = buildAgentConfig(config, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
-
-		expect(result.provider).toEqual({
-			providers: [{ name: "anthropic" }],
-			selection: {
-				type: "fallback",
-				order: ["anthropic"],
-			},
-		});
-	});
-
-	test("should build smart multi-provider config", () => {
-		const config: AgentYamlConfig = {
-			...baseConfig,
-			provider: {
-				default: "anthropic",
-				multiProvider: {
-					strategy: "smart",
-					weights: { cost: 0.2, latency: 0.3, quality: 0.5 },
-				},
-			},
-		};
-
-		const result = buildAgentConfig(config, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
-
-		expect(result.provider).toEqual({
-			providers: [{ name: "anthropic" }],
-			selection: {
-				type: "smart",
-				weights: { cost: 0.2, latency: 0.3, quality: 0.5 },
-			},
-		});
-	});
-
-	test("should use default weights for smart strategy when not specified", () => {
-		const config: AgentYamlConfig = {
-			...baseConfig,
-			provider: {
-				default: "anthropic",
-				multiProvider: {
-					strategy: "smart",
-				},
-			},
-		};
-
-		const result = buildAgentConfig(config, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
-
-		expect(result.provider).toEqual({
-			providers: [{ name: "anthropic" }],
-			selection: {
-				type: "smart",
-				weights: { cost: 0.33, latency: 0.33, quality: 0.34 },
-			},
-		});
-	});
-
 	test("should build multi-provider config with provider definitions", () => {
 		const config: AgentYamlConfig = {
-			...baseConfig,
+			...MINIMAL_CONFIG,
 			provider: {
 				default: "anthropic",
 				providers: {
@@ -502,10 +333,7 @@ describe("buildAgentConfig - multi-provider strategies", () => {
 			},
 		};
 
-		const result = buildAgentConfig(config, {
-			workspaceDir: "/workspace/test",
-			sessionId: "session-123",
-		});
+		const result = buildAgentConfig(config, BUILD_OPTIONS);
 
 		// apiKey will be undefined since env vars are not set in test
 		expect(result.provider).toEqual({
@@ -184,6 +184,23 @@ describe("AuditLogger", () => {
 		expect(events[0].params.command).toBe("ls");
 	});
 
+	it("should sanitize sensitive params regardless of key casing", () => {
+		logger.logResult(
+			"session1",
+			"web_search",
+			"query",
+			{ apiKey: "k", AUTH_TOKEN: "t", nested: { clientSecret: "s", query: "q" } },
+			"success",
+			PermissionTier.READ,
+			false,
+		);
+
+		const params = sink.query({})[0].params;
+		expect(params.apiKey).toBe("[REDACTED]");
+		expect(params.AUTH_TOKEN).toBe("[REDACTED]");
+		expect(params.nested).toEqual({ clientSecret: "[REDACTED]", query: "q" });
+	});
+
 	it("should not log when disabled", () => {
 		const disabledLogger = new AuditLogger(sink, false);
 